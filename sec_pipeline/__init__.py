@@ -1,20 +1,48 @@
 """SEC EDGAR XBRL financial filing ingestion pipeline."""
 
-from sec_pipeline.ingestion.sec_api import SECAPIClient, get_sec_client
-from sec_pipeline.ingestion.schemas import XBRLFiling, XBRLFilingsResponse
-from sec_pipeline.transformation.xbrl_parser import XBRLParserService, get_xbrl_parser_service
-from sec_pipeline.ingestion.sec_url_builder import (
-    build_sec_viewer_url,
-    build_sec_document_url,
-    build_sec_filing_index_url,
-    build_fact_sec_urls,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sec_pipeline.ingestion.sec_api import SECAPIClient, get_sec_client
+    from sec_pipeline.ingestion.schemas import XBRLFiling, XBRLFilingsResponse
+    from sec_pipeline.transformation.xbrl_parser import XBRLParserService, get_xbrl_parser_service
+    from sec_pipeline.transformation.role_extractor import (
+        fetch_role_definitions,
+        fetch_statement_descriptions,
+    )
+    from sec_pipeline.ingestion.sec_url_builder import (
+        build_sec_viewer_url,
+        build_sec_document_url,
+        build_sec_filing_index_url,
+        build_fact_sec_urls,
+    )
+
+# PEP 562 lazy re-exports. The transformation layer transitively imports
+# Arelle (a 1s+ import), so nothing below is imported until the name is
+# actually accessed — `import sec_pipeline` for URL building or fetching
+# stays in the milliseconds and works without Arelle installed.
+_EXPORTS = {
+    "SECAPIClient": "sec_pipeline.ingestion.sec_api",
+    "get_sec_client": "sec_pipeline.ingestion.sec_api",
+    "XBRLFiling": "sec_pipeline.ingestion.schemas",
+    "XBRLFilingsResponse": "sec_pipeline.ingestion.schemas",
+    "XBRLParserService": "sec_pipeline.transformation.xbrl_parser",
+    "get_xbrl_parser_service": "sec_pipeline.transformation.xbrl_parser",
+    "fetch_role_definitions": "sec_pipeline.transformation.role_extractor",
+    "fetch_statement_descriptions": "sec_pipeline.transformation.role_extractor",
+    "build_sec_viewer_url": "sec_pipeline.ingestion.sec_url_builder",
+    "build_sec_document_url": "sec_pipeline.ingestion.sec_url_builder",
+    "build_sec_filing_index_url": "sec_pipeline.ingestion.sec_url_builder",
+    "build_fact_sec_urls": "sec_pipeline.ingestion.sec_url_builder",
+}
 
 __all__ = [
     "SECAPIClient",
     "get_sec_client",
     "XBRLParserService",
     "get_xbrl_parser_service",
+    "fetch_role_definitions",
+    "fetch_statement_descriptions",
     "XBRLFiling",
     "XBRLFilingsResponse",
     "build_sec_viewer_url",
@@ -22,3 +50,20 @@ __all__ = [
     "build_sec_filing_index_url",
     "build_fact_sec_urls",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache so subsequent accesses skip __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
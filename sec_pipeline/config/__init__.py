@@ -6,6 +6,51 @@ logger = logging.getLogger(__name__)
 # Matches the SEC EDGAR role definition convention: "NNNNNN - Category - Description"
 _DEFINITION_RE = re.compile(r"^\d+\s*-\s*(.+?)\s*-\s*(.+)$")
 
+# Canonicalization for deduplication: apostrophes are dropped (so
+# "Stockholders'" and "Stockholders" match) while any other punctuation
+# becomes a space (so "Balance-Sheets" and "Balance Sheets" match)
+_APOSTROPHE_RE = re.compile(r"['’]")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+# Trailing boilerplate that distinguishes otherwise-identical descriptions
+_BOILERPLATE_SUFFIX_RE = re.compile(
+    r"\s*\((?:Unaudited|Parenthetical|Restated)\)\s*$", re.IGNORECASE
+)
+_TRAILING_YEAR_RE = re.compile(r"\s*\b(?:19|20)\d{2}\s*$")
+
+
+def strip_description_boilerplate(description: str) -> str:
+    """Drop trailing boilerplate from a role description.
+
+    Removes suffixes like ``(Unaudited)``, ``(Parenthetical)``,
+    ``(Restated)`` and trailing year stamps, which multiply otherwise-
+    identical statement names. Suffixes can stack in any order
+    (``"... (Unaudited) 2023"``), so stripping loops until nothing
+    changes. Apply before :func:`normalize_description` so boilerplate
+    variants collapse to the same canonical key.
+    """
+    stripped = description.strip()
+    while True:
+        candidate = _BOILERPLATE_SUFFIX_RE.sub("", stripped)
+        candidate = _TRAILING_YEAR_RE.sub("", candidate).strip()
+        if candidate == stripped:
+            return stripped
+        stripped = candidate
+
+
+def normalize_description(description: str) -> str:
+    """Canonicalize a role description for deduplication.
+
+    Lowercases, drops apostrophes, and replaces remaining punctuation
+    with a space (collapsing runs) so case/punctuation variants of the
+    same statement name (e.g. ``"Balance-Sheets"`` vs
+    ``"Balance Sheets"``, ``"Stockholders' Equity"`` vs
+    ``"Stockholders Equity"``) map to one key. Group descriptions by this key before handing them to
+    an expensive downstream step such as classification.
+    """
+    canonical = _APOSTROPHE_RE.sub("", description.lower())
+    return _NON_ALNUM_RE.sub(" ", canonical).strip()
+
 
 def parse_role_definition(definition: str) -> tuple[str, str] | None:
     """Parse an EDGAR role definition into (category, description).
@@ -13,6 +58,14 @@ def parse_role_definition(definition: str) -> tuple[str, str] | None:
     Expects the ``NNNNNN - Category - Description`` convention.
     Returns ``None`` if the definition does not conform.
     """
+    # Fast path: well-formed definitions use " - " separators, so a plain
+    # split avoids the regex engine entirely. This runs for every role of
+    # every filing, so the constant factor matters.
+    parts = definition.split(" - ", 2)
+    if len(parts) == 3 and parts[0].strip().isdigit():
+        return parts[1].strip(), parts[2].strip()
+
+    # Fallback: tolerate malformed spacing around the separators
     m = _DEFINITION_RE.match(definition)
     if m is None:
         return None
@@ -3,14 +3,33 @@ Ingestion Layer
 
 External data sources and API clients for fetching financial data.
 """
-from sec_pipeline.ingestion.sec_api import sec_client, SECAPIClient, get_sec_client
-from sec_pipeline.ingestion.schemas import XBRLFiling, XBRLFilingsResponse
-from sec_pipeline.ingestion.sec_url_builder import (
-    build_sec_viewer_url,
-    build_sec_document_url,
-    build_sec_filing_index_url,
-    build_fact_sec_urls,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sec_pipeline.ingestion.sec_api import sec_client, SECAPIClient, get_sec_client
+    from sec_pipeline.ingestion.schemas import XBRLFiling, XBRLFilingsResponse
+    from sec_pipeline.ingestion.sec_url_builder import (
+        build_sec_viewer_url,
+        build_sec_document_url,
+        build_sec_filing_index_url,
+        build_fact_sec_urls,
+    )
+
+# PEP 562 lazy re-exports, matching the top-level and transformation
+# __init__ files. Eagerly importing `sec_client` here would resolve
+# sec_api's module __getattr__ at import time and construct the singleton
+# with fallback settings before callers can pass their own User-Agent.
+_EXPORTS = {
+    "sec_client": "sec_pipeline.ingestion.sec_api",
+    "SECAPIClient": "sec_pipeline.ingestion.sec_api",
+    "get_sec_client": "sec_pipeline.ingestion.sec_api",
+    "XBRLFiling": "sec_pipeline.ingestion.schemas",
+    "XBRLFilingsResponse": "sec_pipeline.ingestion.schemas",
+    "build_sec_viewer_url": "sec_pipeline.ingestion.sec_url_builder",
+    "build_sec_document_url": "sec_pipeline.ingestion.sec_url_builder",
+    "build_sec_filing_index_url": "sec_pipeline.ingestion.sec_url_builder",
+    "build_fact_sec_urls": "sec_pipeline.ingestion.sec_url_builder",
+}
 
 __all__ = [
     "sec_client",
@@ -23,3 +42,19 @@ __all__ = [
     "build_sec_filing_index_url",
     "build_fact_sec_urls",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
@@ -0,0 +1,49 @@
+"""
+On-disk cache for the resolved ticker → CIK index.
+
+Survives process restarts so cold starts don't refetch company_tickers.json
+from SEC when a fresh copy is already on disk. Writes are atomic
+(tmp file + os.replace) and corruption or permission problems degrade to
+a cache miss rather than an error.
+"""
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+_CACHE_PATH = Path(
+    os.environ.get(
+        "SEC_TICKER_CACHE_PATH",
+        os.path.join(os.path.expanduser("~"), ".cache", "sec-xbrl-pipeline", "tickers.json"),
+    )
+)
+
+
+def load(ttl_seconds: float) -> Optional[dict]:
+    """Return the cached ticker index if the on-disk copy is younger than ttl_seconds."""
+    try:
+        payload = orjson.loads(_CACHE_PATH.read_bytes())
+        if time.time() - payload["ts"] >= ttl_seconds:
+            return None
+        return payload["tickers"]
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning("Ignoring unreadable ticker cache %s: %s", _CACHE_PATH, e)
+        return None
+
+
+def save(tickers: dict) -> None:
+    """Persist the ticker index atomically; failures are logged, not raised."""
+    try:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _CACHE_PATH.with_suffix(".tmp")
+        tmp_path.write_bytes(orjson.dumps({"ts": time.time(), "tickers": tickers}))
+        os.replace(tmp_path, _CACHE_PATH)
+    except OSError as e:
+        logger.warning("Could not persist ticker cache to %s: %s", _CACHE_PATH, e)
@@ -1,6 +1,9 @@
 import asyncio
 import httpx
 import logging
+import orjson
+import time
+from itertools import zip_longest
 from typing import Optional
 
 from tenacity import (
@@ -10,10 +13,37 @@ from tenacity import (
     stop_after_attempt,
 )
 
+from sec_pipeline.ingestion import _ticker_cache
 from sec_pipeline.ingestion.schemas import XBRLFiling, XBRLFilingsResponse
 
+try:  # optional: install with `pip install sec-xbrl-pipeline[cache]`
+    import hishel
+
+    if not hasattr(hishel, "AsyncCacheClient"):  # hishel 1.x dropped this API
+        hishel = None
+except ImportError:
+    hishel = None
+
 logger = logging.getLogger(__name__)
 
+# On-disk HTTP cache used when hishel is installed. SEC endpoints return
+# ETag/Last-Modified, so revalidation turns repeated polls of unchanged
+# submissions into ~0-byte 304 responses instead of multi-MB downloads.
+_HTTP_CACHE_DIR = ".cache/sec"
+
+# In-process cache for company_tickers.json (~1 MB, ~10k entries), shared
+# across client instances. SEC refreshes the file daily, so a 24h TTL
+# matches the source's cadence. The lock prevents a thundering herd of
+# concurrent lookups all refetching on a cold cache.
+_TICKERS_CACHE: dict | None = None
+_TICKERS_CACHE_TS: float = 0.0
+_TICKERS_TTL_SECONDS = 86400
+_TICKERS_LOCK = asyncio.Lock()
+
+# Translation table for stripping dashes from accession numbers; faster
+# than str.replace for the short fixed pattern and built once
+_DASH_STRIPPER = str.maketrans("", "", "-")
+
 
 class SECAPIClient:
     """Client for interacting with SEC EDGAR API."""
@@ -41,18 +71,58 @@ class SECAPIClient:
             "User-Agent": user_agent,
             "Accept-Encoding": "gzip, deflate"
         }
-        logger.info(f"Initialized SEC API client with User-Agent: {user_agent}")
+        # Pooled client shared across all requests; created lazily so
+        # construction never opens sockets
+        self._client: httpx.AsyncClient | None = None
+        logger.info("Initialized SEC API client with User-Agent: %s", user_agent)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client.
+
+        Reusing one client keeps connections alive across requests
+        (multiplexed over HTTP/2), instead of paying a TCP+TLS handshake
+        per call against data.sec.gov.
+        """
+        if self._client is None or self._client.is_closed:
+            kwargs = dict(
+                headers=self.headers,
+                http2=True,
+                # Transport retries cover connection-level failures
+                # (refused/reset sockets) before a request even goes out
+                transport=httpx.AsyncHTTPTransport(retries=3),
+                timeout=httpx.Timeout(connect=5.0, read=15.0, write=5.0, pool=5.0),
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
+            if hishel is not None:
+                # Conditional GETs against ETag/Last-Modified: unchanged
+                # submissions come back as 304s served from the file cache
+                self._client = hishel.AsyncCacheClient(
+                    storage=hishel.AsyncFileStorage(base_path=_HTTP_CACHE_DIR),
+                    controller=hishel.Controller(always_revalidate=True),
+                    **kwargs,
+                )
+            else:
+                self._client = httpx.AsyncClient(**kwargs)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client (call at app shutdown)."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
 
     @retry(
         wait=wait_exponential(multiplier=30, max=300),
         stop=stop_after_attempt(5),
-        retry=retry_if_exception_type(httpx.HTTPStatusError),
+        retry=retry_if_exception_type(
+            (httpx.HTTPStatusError, httpx.TimeoutException, httpx.RemoteProtocolError)
+        ),
     )
-    async def _throttled_get(self, client: httpx.AsyncClient, url: str) -> httpx.Response:
-        """Rate-limited GET with retry/backoff for 429/403 responses."""
+    async def _throttled_get(self, url: str) -> httpx.Response:
+        """Rate-limited GET with retry/backoff for 429/403 and transient transport errors."""
         async with self._request_semaphore:
             await asyncio.sleep(self._min_interval)
-            response = await client.get(url, headers=self.headers)
+            response = await self._get_client().get(url)
             response.raise_for_status()
             return response
 
@@ -60,21 +130,70 @@ class SECAPIClient:
         """
         Get company CIK and name from ticker symbol.
 
+        Resolves through SEC's ticker lookup table (cached in-process).
+        The submissions endpoint takes a CIK, not a ticker, so there is
+        no direct per-ticker endpoint to try first.
+
         Args:
             ticker: Stock ticker symbol (e.g., 'AAPL')
 
         Returns:
             Dict with CIK and company name, or None if not found
         """
-        url = f"{self.BASE_URL}/submissions/CIK{ticker.upper()}.json"
+        return await self._lookup_ticker(ticker)
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await self._throttled_get(client, url)
-                return response.json()
-            except httpx.HTTPStatusError:
-                # Try ticker lookup file
-                return await self._lookup_ticker(ticker)
+    async def _get_company_tickers(self) -> dict:
+        """
+        Get the SEC ticker → company index, cached in-process with a 24h TTL.
+
+        The index is keyed by uppercased ticker symbol, built once per
+        fetch, so lookups are a single dict hit instead of a linear scan
+        over ~10k entries.
+
+        Returns:
+            Dict mapping ticker symbol to {"cik", "name"}
+        """
+        global _TICKERS_CACHE, _TICKERS_CACHE_TS
+
+        if (
+            _TICKERS_CACHE is not None
+            and time.monotonic() - _TICKERS_CACHE_TS < _TICKERS_TTL_SECONDS
+        ):
+            return _TICKERS_CACHE
+
+        async with _TICKERS_LOCK:
+            # Re-check under the lock so concurrent cold-cache callers
+            # trigger a single fetch
+            if (
+                _TICKERS_CACHE is not None
+                and time.monotonic() - _TICKERS_CACHE_TS < _TICKERS_TTL_SECONDS
+            ):
+                return _TICKERS_CACHE
+
+            # Disk cache first: a fresh copy from a previous process
+            # saves the ~1 MB download on cold starts
+            by_ticker = _ticker_cache.load(_TICKERS_TTL_SECONDS)
+            if by_ticker is None:
+                url = self.COMPANY_TICKERS_URL
+                logger.info("Fetching SEC company tickers from: %s", url)
+                response = await self._throttled_get(url)
+                data = orjson.loads(response.content)
+                logger.info("Successfully fetched %d companies from SEC", len(data))
+
+                # Upcase keys once here rather than per lookup
+                by_ticker = {
+                    company["ticker"].upper(): {
+                        "cik": str(company["cik_str"]).zfill(10),
+                        "name": company["title"],
+                    }
+                    for company in data.values()
+                    if company.get("ticker")
+                }
+                _ticker_cache.save(by_ticker)
+
+            _TICKERS_CACHE = by_ticker
+            _TICKERS_CACHE_TS = time.monotonic()
+            return by_ticker
 
     async def _lookup_ticker(self, ticker: str) -> Optional[dict]:
         """
@@ -86,34 +205,78 @@ class SECAPIClient:
         Returns:
             Dict with CIK and company name, or None if not found
         """
-        url = self.COMPANY_TICKERS_URL
-
-        async with httpx.AsyncClient() as client:
-            try:
-                logger.info(f"Fetching SEC company tickers from: {url}")
-                response = await self._throttled_get(client, url)
-                data = response.json()
-                logger.info(f"Successfully fetched {len(data)} companies from SEC")
-
-                # Search for ticker in the data
-                for key, company in data.items():
-                    if company.get("ticker", "").upper() == ticker.upper():
-                        cik = str(company["cik_str"]).zfill(10)
-                        logger.info(f"Found ticker {ticker}: CIK={cik}, Name={company['title']}")
-                        return {
-                            "cik": cik,
-                            "name": company["title"]
-                        }
-
-                logger.warning(f"Ticker '{ticker}' not found in {len(data)} SEC companies")
-                return None
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error looking up ticker '{ticker}': {e.response.status_code} - {e.response.text}")
-                return None
-            except Exception as e:
-                logger.error(f"Unexpected error looking up ticker '{ticker}': {type(e).__name__}: {str(e)}")
+        # Normalize once; the lookup table is keyed by uppercase ticker
+        ticker = ticker.upper()
+        try:
+            by_ticker = await self._get_company_tickers()
+
+            hit = by_ticker.get(ticker)
+            if hit is None:
+                logger.warning("Ticker %r not found in %d SEC companies", ticker, len(by_ticker))
                 return None
 
+            logger.info("Found ticker %s: CIK=%s, Name=%s", ticker, hit["cik"], hit["name"])
+            # Copy so callers can't mutate the cached entry
+            return dict(hit)
+        except httpx.HTTPStatusError as e:
+            logger.error("HTTP error looking up ticker %r: %s - %s", ticker, e.response.status_code, e.response.text)
+            return None
+        except Exception as e:
+            logger.error("Unexpected error looking up ticker %r: %s: %s", ticker, type(e).__name__, e)
+            return None
+
+    def _make_filing(self, row: tuple, archives_prefix: str) -> Optional[XBRLFiling]:
+        """Build one XBRLFiling from a row of parallel-array values, or None for non-XBRL rows."""
+        (
+            form,
+            filing_date,
+            accession_no,
+            report_date,
+            file_number,
+            film_number,
+            primary_doc,
+            primary_doc_description,
+            is_xbrl,
+            is_inline,
+        ) = row
+
+        if not is_xbrl:
+            return None
+
+        accession_no_dashes = accession_no.translate(_DASH_STRIPPER)
+
+        xbrl_instance_url = None
+        primary_doc_url = None
+
+        if primary_doc:
+            base_url = f"{archives_prefix}/{accession_no_dashes}"
+            primary_doc_url = f"{base_url}/{primary_doc}"
+
+            # Split the extension once instead of two endswith calls per row
+            ext = primary_doc.rpartition(".")[2]
+            if is_inline and ext == "htm":
+                xbrl_filename = primary_doc.replace(".htm", "_htm.xml")
+                xbrl_instance_url = f"{base_url}/{xbrl_filename}"
+            elif ext == "xml":
+                xbrl_instance_url = primary_doc_url
+
+        # model_construct skips per-field validation; the values come
+        # straight from SEC EDGAR's typed JSON arrays and are coerced above
+        return XBRLFiling.model_construct(
+            accession_number=accession_no,
+            filing_date=filing_date,
+            report_date=report_date,
+            form_type=form,
+            file_number=file_number,
+            film_number=film_number,
+            primary_document=primary_doc,
+            primary_doc_description=primary_doc_description,
+            is_xbrl=bool(is_xbrl),
+            is_inline_xbrl=bool(is_inline),
+            xbrl_instance_url=xbrl_instance_url,
+            primary_document_url=primary_doc_url,
+        )
+
     def _extract_xbrl_filings(self, filing_arrays: dict, cik: str) -> list[XBRLFiling]:
         """
         Extract XBRL filings from SEC EDGAR filing arrays.
@@ -125,58 +288,29 @@ class SECAPIClient:
         Returns:
             List of XBRLFiling objects for filings that have XBRL data
         """
-        filings = []
-
-        forms = filing_arrays.get("form", [])
-        filing_dates = filing_arrays.get("filingDate", [])
-        accession_numbers = filing_arrays.get("accessionNumber", [])
-        report_dates = filing_arrays.get("reportDate", [])
-        file_numbers = filing_arrays.get("fileNumber", [])
-        film_numbers = filing_arrays.get("filmNumber", [])
-        primary_documents = filing_arrays.get("primaryDocument", [])
-        primary_doc_descriptions = filing_arrays.get("primaryDocDescription", [])
-        is_xbrl_list = filing_arrays.get("isXBRL", [])
-        is_inline_xbrl_list = filing_arrays.get("isInlineXBRL", [])
-
-        for i in range(len(forms)):
-            is_xbrl = is_xbrl_list[i] if i < len(is_xbrl_list) else False
-
-            if is_xbrl:
-                is_inline = is_inline_xbrl_list[i] if i < len(is_inline_xbrl_list) else False
-                primary_doc = primary_documents[i] if i < len(primary_documents) else None
-                accession_no = accession_numbers[i]
-                accession_no_dashes = accession_no.replace("-", "")
-
-                xbrl_instance_url = None
-                primary_doc_url = None
-
-                if primary_doc:
-                    base_url = f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession_no_dashes}"
-                    primary_doc_url = f"{base_url}/{primary_doc}"
-
-                    if is_inline and primary_doc.endswith(".htm"):
-                        xbrl_filename = primary_doc.replace(".htm", "_htm.xml")
-                        xbrl_instance_url = f"{base_url}/{xbrl_filename}"
-                    elif primary_doc.endswith(".xml"):
-                        xbrl_instance_url = primary_doc_url
-
-                filing = XBRLFiling(
-                    accession_number=accession_no,
-                    filing_date=filing_dates[i],
-                    report_date=report_dates[i] if i < len(report_dates) else None,
-                    form_type=forms[i],
-                    file_number=file_numbers[i] if i < len(file_numbers) else None,
-                    film_number=film_numbers[i] if i < len(film_numbers) else None,
-                    primary_document=primary_doc,
-                    primary_doc_description=primary_doc_descriptions[i] if i < len(primary_doc_descriptions) else None,
-                    is_xbrl=is_xbrl,
-                    is_inline_xbrl=is_inline,
-                    xbrl_instance_url=xbrl_instance_url,
-                    primary_document_url=primary_doc_url,
-                )
-                filings.append(filing)
+        # Iterate the parallel arrays in one pass; fillvalue=None replaces
+        # the per-index bounds checks the old loop did for every column
+        rows = zip_longest(
+            filing_arrays.get("form", []),
+            filing_arrays.get("filingDate", []),
+            filing_arrays.get("accessionNumber", []),
+            filing_arrays.get("reportDate", []),
+            filing_arrays.get("fileNumber", []),
+            filing_arrays.get("filmNumber", []),
+            filing_arrays.get("primaryDocument", []),
+            filing_arrays.get("primaryDocDescription", []),
+            filing_arrays.get("isXBRL", []),
+            filing_arrays.get("isInlineXBRL", []),
+            fillvalue=None,
+        )
+
+        # cik is invariant; build the URL prefix once outside the loop
+        archives_prefix = f"https://www.sec.gov/Archives/edgar/data/{cik}"
 
-        return filings
+        # Comprehension keeps the filter-and-collect loop in tight bytecode
+        # with no per-row append attribute lookup
+        make = self._make_filing
+        return [f for f in (make(row, archives_prefix) for row in rows) if f is not None]
 
     async def get_company_filings(self, ticker: str) -> XBRLFilingsResponse:
         """
@@ -195,6 +329,9 @@ class SECAPIClient:
             ValueError: If ticker not found
             httpx.HTTPError: If API request fails
         """
+        # Normalize once; reused for lookup and the response below
+        ticker = ticker.upper()
+
         # First, get company CIK
         company_info = await self._lookup_ticker(ticker)
 
@@ -207,42 +344,41 @@ class SECAPIClient:
         # Get company submissions
         url = f"{self.BASE_URL}/submissions/CIK{cik}.json"
 
-        async with httpx.AsyncClient() as client:
-            response = await self._throttled_get(client, url)
-            data = response.json()
-
-            # Extract company metadata
-            sic_code = data.get("sic")
-            sic_description = data.get("sicDescription")
-            entity_type = data.get("entityType")
-            state_of_incorporation = data.get("stateOfIncorporation")
-            fiscal_year_end = data.get("fiscalYearEnd")
-
-            # Tickers/exchanges are arrays; take first if available
-            exchanges = data.get("exchanges", [])
-            exchange = exchanges[0] if exchanges else None
-
-            # Extract XBRL filings from the "recent" page
-            recent_filings = data.get("filings", {}).get("recent", {})
-            filings = self._extract_xbrl_filings(recent_filings, cik)
-
-            # Paginate through additional filing pages for historical filings
-            additional_files = data.get("filings", {}).get("files", [])
-            for file_ref in additional_files:
-                file_name = file_ref.get("name")
-                if not file_name:
-                    continue
-                page_url = f"{self.BASE_URL}/submissions/{file_name}"
-                try:
-                    page_response = await self._throttled_get(client, page_url)
-                    page_data = page_response.json()
-                    filings.extend(self._extract_xbrl_filings(page_data, cik))
-                except Exception as e:
-                    logger.warning(f"Failed to fetch filing page {file_name}: {e}")
-                    continue
+        response = await self._throttled_get(url)
+        data = orjson.loads(response.content)
+
+        # Extract company metadata
+        sic_code = data.get("sic")
+        sic_description = data.get("sicDescription")
+        entity_type = data.get("entityType")
+        state_of_incorporation = data.get("stateOfIncorporation")
+        fiscal_year_end = data.get("fiscalYearEnd")
+
+        # Tickers/exchanges are arrays; take first if available
+        exchanges = data.get("exchanges", [])
+        exchange = exchanges[0] if exchanges else None
+
+        # Extract XBRL filings from the "recent" page
+        recent_filings = data.get("filings", {}).get("recent", {})
+        filings = self._extract_xbrl_filings(recent_filings, cik)
+
+        # Paginate through additional filing pages for historical filings
+        additional_files = data.get("filings", {}).get("files", [])
+        for file_ref in additional_files:
+            file_name = file_ref.get("name")
+            if not file_name:
+                continue
+            page_url = f"{self.BASE_URL}/submissions/{file_name}"
+            try:
+                page_response = await self._throttled_get(page_url)
+                page_data = orjson.loads(page_response.content)
+                filings.extend(self._extract_xbrl_filings(page_data, cik))
+            except Exception as e:
+                logger.warning("Failed to fetch filing page %s: %s", file_name, e)
+                continue
 
         return XBRLFilingsResponse(
-            ticker=ticker.upper(),
+            ticker=ticker,
             cik=cik,
             company_name=company_name,
             filings=filings,
@@ -255,6 +391,38 @@ class SECAPIClient:
             exchange=exchange,
         )
 
+    async def get_many_company_filings(
+        self,
+        tickers: list[str],
+        max_concurrency: int = 8,
+    ) -> list[XBRLFilingsResponse | BaseException]:
+        """
+        Get XBRL filings for many tickers concurrently.
+
+        The workload is dominated by network wait, so bounded fan-out
+        gives near-linear speedup. Fan-out is capped by max_concurrency,
+        and the per-request throttle in _throttled_get keeps the combined
+        request rate within SEC's fair-access limit regardless.
+
+        Args:
+            tickers: Stock ticker symbols (e.g., ['AAPL', 'MSFT'])
+            max_concurrency: Maximum tickers fetched at once
+
+        Returns:
+            One entry per ticker, in input order: the XBRLFilingsResponse,
+            or the exception raised while fetching that ticker
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _fetch_one(ticker: str) -> XBRLFilingsResponse:
+            async with semaphore:
+                return await self.get_company_filings(ticker)
+
+        return await asyncio.gather(
+            *(_fetch_one(ticker) for ticker in tickers),
+            return_exceptions=True,
+        )
+
     async def get_company_filings_by_cik(self, cik: str) -> XBRLFilingsResponse:
         """
         Get all XBRL filings for a given CIK, including historical filings.
@@ -272,41 +440,40 @@ class SECAPIClient:
         """
         url = f"{self.BASE_URL}/submissions/CIK{cik}.json"
 
-        async with httpx.AsyncClient() as client:
-            response = await self._throttled_get(client, url)
-            data = response.json()
-
-            company_name = data["name"]
-            tickers = data.get("tickers", [])
-            ticker = tickers[0] if tickers else None
-
-            sic_code = data.get("sic")
-            sic_description = data.get("sicDescription")
-            entity_type = data.get("entityType")
-            state_of_incorporation = data.get("stateOfIncorporation")
-            fiscal_year_end = data.get("fiscalYearEnd")
-
-            exchanges = data.get("exchanges", [])
-            exchange = exchanges[0] if exchanges else None
-
-            # Extract XBRL filings from the "recent" page
-            recent_filings = data.get("filings", {}).get("recent", {})
-            filings = self._extract_xbrl_filings(recent_filings, cik)
-
-            # Paginate through additional filing pages for historical filings
-            additional_files = data.get("filings", {}).get("files", [])
-            for file_ref in additional_files:
-                file_name = file_ref.get("name")
-                if not file_name:
-                    continue
-                page_url = f"{self.BASE_URL}/submissions/{file_name}"
-                try:
-                    page_response = await self._throttled_get(client, page_url)
-                    page_data = page_response.json()
-                    filings.extend(self._extract_xbrl_filings(page_data, cik))
-                except Exception as e:
-                    logger.warning(f"Failed to fetch filing page {file_name}: {e}")
-                    continue
+        response = await self._throttled_get(url)
+        data = orjson.loads(response.content)
+
+        company_name = data["name"]
+        tickers = data.get("tickers", [])
+        ticker = tickers[0] if tickers else None
+
+        sic_code = data.get("sic")
+        sic_description = data.get("sicDescription")
+        entity_type = data.get("entityType")
+        state_of_incorporation = data.get("stateOfIncorporation")
+        fiscal_year_end = data.get("fiscalYearEnd")
+
+        exchanges = data.get("exchanges", [])
+        exchange = exchanges[0] if exchanges else None
+
+        # Extract XBRL filings from the "recent" page
+        recent_filings = data.get("filings", {}).get("recent", {})
+        filings = self._extract_xbrl_filings(recent_filings, cik)
+
+        # Paginate through additional filing pages for historical filings
+        additional_files = data.get("filings", {}).get("files", [])
+        for file_ref in additional_files:
+            file_name = file_ref.get("name")
+            if not file_name:
+                continue
+            page_url = f"{self.BASE_URL}/submissions/{file_name}"
+            try:
+                page_response = await self._throttled_get(page_url)
+                page_data = orjson.loads(page_response.content)
+                filings.extend(self._extract_xbrl_filings(page_data, cik))
+            except Exception as e:
+                logger.warning("Failed to fetch filing page %s: %s", file_name, e)
+                continue
 
         return XBRLFilingsResponse(
             ticker=ticker,
@@ -334,10 +501,12 @@ def get_sec_client(**kwargs) -> SECAPIClient:
     return _sec_client
 
 
-class _LazyClient:
-    """Proxy that defers SECAPIClient construction until first use."""
-    def __getattr__(self, name):
-        return getattr(get_sec_client(), name)
-
-
-sec_client = _LazyClient()
+def __getattr__(name: str):
+    # PEP 562: `sec_client` stays importable for existing callers, but is
+    # now the real SECAPIClient, constructed on first access and cached in
+    # module globals — no per-attribute proxy indirection on hot paths.
+    if name == "sec_client":
+        client = get_sec_client()
+        globals()["sec_client"] = client
+        return client
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
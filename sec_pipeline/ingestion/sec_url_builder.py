@@ -4,8 +4,58 @@ SEC URL Builder Service
 Builds URLs to SEC EDGAR filing documents and the inline XBRL viewer
 with optional anchor links to specific facts.
 """
+from functools import lru_cache
 from typing import Optional
 
+# Constant URL skeletons, assembled once at import. %-interpolation on a
+# precomputed template avoids re-parsing the format string per call.
+_VIEWER_URL_TMPL = (
+    "https://www.sec.gov/cgi-bin/viewer"
+    "?action=view"
+    "&cik=%s"
+    "&accession_number=%s"
+    "&xbrl_type=v"
+)
+_DOCUMENT_URL_TMPL = "https://www.sec.gov/Archives/edgar/data/%s/%s/%s"
+_INDEX_URL_TMPL = (
+    "https://www.sec.gov/cgi-bin/browse-edgar"
+    "?action=getcompany"
+    "&CIK=%s"
+    "&type=&dateb=&owner=exclude&count=100"
+)
+
+
+@lru_cache(maxsize=4096)
+def _pad_cik(cik: str) -> str:
+    """Zero-pad a CIK to 10 digits. Cached — the same CIK repeats for every fact of a filing."""
+    return str(cik).zfill(10)
+
+
+def _viewer_url(cik_padded: str, accession_number: str, fact_anchor_id: Optional[str]) -> str:
+    """Build the viewer URL from already-normalized components."""
+    url = _VIEWER_URL_TMPL % (cik_padded, accession_number)
+    if fact_anchor_id:
+        url += f"#{fact_anchor_id}"
+    return url
+
+
+def _document_url(
+    cik_padded: str,
+    accession_no_clean: str,
+    primary_document: str,
+    fact_anchor_id: Optional[str],
+) -> str:
+    """Build the raw document URL from already-normalized components."""
+    url = _DOCUMENT_URL_TMPL % (cik_padded, accession_no_clean, primary_document)
+    if fact_anchor_id:
+        url += f"#{fact_anchor_id}"
+    return url
+
+
+def _index_url(cik_padded: str) -> str:
+    """Build the filing index URL from an already-normalized CIK."""
+    return _INDEX_URL_TMPL % cik_padded
+
 
 def build_sec_viewer_url(
     cik: str,
@@ -30,23 +80,7 @@ def build_sec_viewer_url(
         >>> build_sec_viewer_url("0000320193", "0000320193-25-000073", "fact-123")
         'https://www.sec.gov/cgi-bin/viewer?action=view&cik=0000320193&accession_number=0000320193-25-000073&xbrl_type=v#fact-123'
     """
-    # Ensure CIK is 10 digits with leading zeros
-    cik_padded = str(cik).zfill(10)
-
-    # Build base viewer URL
-    url = (
-        f"https://www.sec.gov/cgi-bin/viewer"
-        f"?action=view"
-        f"&cik={cik_padded}"
-        f"&accession_number={accession_number}"
-        f"&xbrl_type=v"
-    )
-
-    # Add anchor if provided
-    if fact_anchor_id:
-        url += f"#{fact_anchor_id}"
-
-    return url
+    return _viewer_url(_pad_cik(cik), accession_number, fact_anchor_id)
 
 
 def build_sec_document_url(
@@ -74,24 +108,13 @@ def build_sec_document_url(
         >>> build_sec_document_url("0000320193", "0000320193-25-000073", "aapl-20250628.htm", "fact-123")
         'https://www.sec.gov/Archives/edgar/data/0000320193/000032019325000073/aapl-20250628.htm#fact-123'
     """
-    # Remove dashes from accession number for file path
-    accession_no_clean = accession_number.replace("-", "")
-
-    # Ensure CIK is 10 digits with leading zeros
-    cik_padded = str(cik).zfill(10)
-
-    # Build document URL
-    url = (
-        f"https://www.sec.gov/Archives/edgar/data/"
-        f"{cik_padded}/{accession_no_clean}/{primary_document}"
+    return _document_url(
+        _pad_cik(cik),
+        accession_number.replace("-", ""),
+        primary_document,
+        fact_anchor_id,
     )
 
-    # Add anchor if provided
-    if fact_anchor_id:
-        url += f"#{fact_anchor_id}"
-
-    return url
-
 
 def build_sec_filing_index_url(cik: str, accession_number: str) -> str:
     """
@@ -108,21 +131,7 @@ def build_sec_filing_index_url(cik: str, accession_number: str) -> str:
         >>> build_sec_filing_index_url("0000320193", "0000320193-25-000073")
         'https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&CIK=0000320193&type=&dateb=&owner=exclude&count=100&search_text='
     """
-    # Remove dashes from accession number for file path
-    accession_no_clean = accession_number.replace("-", "")
-
-    # Ensure CIK is 10 digits with leading zeros
-    cik_padded = str(cik).zfill(10)
-
-    # Build index URL
-    url = (
-        f"https://www.sec.gov/cgi-bin/browse-edgar"
-        f"?action=getcompany"
-        f"&CIK={cik_padded}"
-        f"&type=&dateb=&owner=exclude&count=100"
-    )
-
-    return url
+    return _index_url(_pad_cik(cik))
 
 
 def build_fact_sec_urls(
@@ -162,9 +171,12 @@ def build_fact_sec_urls(
         >>> urls['search_hint']
         'Search for: Cash and Cash Equivalents'
     """
+    # Normalize once instead of repeating zfill/replace in each builder
+    cik_padded = _pad_cik(cik)
+
     urls = {
-        "viewer_url": build_sec_viewer_url(cik, accession_number, html_anchor_id),
-        "filing_index_url": build_sec_filing_index_url(cik, accession_number),
+        "viewer_url": _viewer_url(cik_padded, accession_number, html_anchor_id),
+        "filing_index_url": _index_url(cik_padded),
         "note": (
             "Anchor link may show statement section, not exact cell. "
             "Use browser search (Ctrl+F) to find specific values."
@@ -173,8 +185,11 @@ def build_fact_sec_urls(
 
     # Only include document URL if we have the primary document filename
     if primary_document:
-        urls["document_url"] = build_sec_document_url(
-            cik, accession_number, primary_document, html_anchor_id
+        urls["document_url"] = _document_url(
+            cik_padded,
+            accession_number.replace("-", ""),
+            primary_document,
+            html_anchor_id,
         )
 
     # Add search hint if concept label is provided
@@ -3,14 +3,57 @@ Transformation Layer
 
 XBRL parsing services.
 """
-from sec_pipeline.transformation.xbrl_parser import (
-    xbrl_parser_service,
-    XBRLParserService,
-    get_xbrl_parser_service,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sec_pipeline.transformation.xbrl_parser import (
+        xbrl_parser_service,
+        XBRLParserService,
+        get_xbrl_parser_service,
+    )
+    from sec_pipeline.transformation.role_extractor import (
+        fetch_role_definitions,
+        fetch_statement_descriptions,
+    )
+    from sec_pipeline.transformation.instance_reader import (
+        fetch_instance_facts,
+        read_xbrl_instance,
+    )
+
+# PEP 562 lazy re-exports: keep the Arelle import (via xbrl_parser) out of
+# the path of callers that only need the lxml-based role extractor
+_EXPORTS = {
+    "xbrl_parser_service": "sec_pipeline.transformation.xbrl_parser",
+    "XBRLParserService": "sec_pipeline.transformation.xbrl_parser",
+    "get_xbrl_parser_service": "sec_pipeline.transformation.xbrl_parser",
+    "fetch_role_definitions": "sec_pipeline.transformation.role_extractor",
+    "fetch_statement_descriptions": "sec_pipeline.transformation.role_extractor",
+    "fetch_instance_facts": "sec_pipeline.transformation.instance_reader",
+    "read_xbrl_instance": "sec_pipeline.transformation.instance_reader",
+}
 
 __all__ = [
     "xbrl_parser_service",
     "XBRLParserService",
     "get_xbrl_parser_service",
+    "fetch_role_definitions",
+    "fetch_statement_descriptions",
+    "fetch_instance_facts",
+    "read_xbrl_instance",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
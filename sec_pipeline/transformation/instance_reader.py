@@ -0,0 +1,256 @@
+"""
+Streaming XBRL Instance Reader
+
+Reads facts, contexts, and units straight out of an XBRL instance
+document with lxml's iterparse — no Arelle model load. Arelle resolves
+and compiles every referenced taxonomy schema before the first fact is
+available, which dominates parse time and memory for a typical filing.
+When the caller only needs the reported values (not labels, concepts, or
+linkbase relationships), this single streaming pass over the instance is
+orders of magnitude cheaper.
+
+The output mirrors the ``contexts`` / ``units`` / ``facts`` / ``summary``
+sections of :meth:`XBRLParserService.parse_xbrl_from_url`, so downstream
+consumers can switch between the two without schema changes. Fields that
+require the taxonomy (labels, data types) are simply absent here.
+"""
+import logging
+from io import BytesIO
+from typing import Any, Dict, List
+
+from lxml import etree
+
+from sec_pipeline.transformation.role_extractor import (
+    _build_headers,
+    _fetch,
+    _get_client,
+)
+
+logger = logging.getLogger(__name__)
+
+_XBRLI = "http://www.xbrl.org/2003/instance"
+_XBRLDI = "http://xbrl.org/2006/xbrldi"
+_XSI = "http://www.w3.org/2001/XMLSchema-instance"
+
+_CONTEXT_TAG = f"{{{_XBRLI}}}context"
+_UNIT_TAG = f"{{{_XBRLI}}}unit"
+_IDENTIFIER_TAG = f"{{{_XBRLI}}}identifier"
+_INSTANT_TAG = f"{{{_XBRLI}}}instant"
+_START_TAG = f"{{{_XBRLI}}}startDate"
+_END_TAG = f"{{{_XBRLI}}}endDate"
+_FOREVER_TAG = f"{{{_XBRLI}}}forever"
+_MEASURE_TAG = f"{{{_XBRLI}}}measure"
+_DIVIDE_TAG = f"{{{_XBRLI}}}divide"
+_NUMERATOR_TAG = f"{{{_XBRLI}}}unitNumerator"
+_DENOMINATOR_TAG = f"{{{_XBRLI}}}unitDenominator"
+_EXPLICIT_MEMBER_TAG = f"{{{_XBRLDI}}}explicitMember"
+_TYPED_MEMBER_TAG = f"{{{_XBRLDI}}}typedMember"
+_XSI_NIL = f"{{{_XSI}}}nil"
+
+# Namespaces whose elements are structural, never facts
+_NON_FACT_NAMESPACES = frozenset((
+    _XBRLI,
+    _XBRLDI,
+    "http://www.xbrl.org/2003/linkbase",
+))
+
+
+def _parse_context(elem: etree._Element) -> Dict[str, Any]:
+    """Build the context dict (entity, period, dimensions) from a completed element."""
+    context_data: Dict[str, Any] = {
+        "id": elem.get("id"),
+        "entity": None,
+        "period": {},
+    }
+
+    dimensions: List[Dict[str, Any]] = []
+    for child in elem.iter():
+        tag = child.tag
+        if tag is etree.Comment:
+            continue
+        if tag == _IDENTIFIER_TAG:
+            context_data["entity"] = {
+                "identifier": (child.text or "").strip(),
+                "scheme": child.get("scheme"),
+            }
+        elif tag == _INSTANT_TAG:
+            context_data["period"]["type"] = "instant"
+            context_data["period"]["instant"] = (child.text or "").strip() or None
+        elif tag == _START_TAG:
+            context_data["period"]["type"] = "duration"
+            context_data["period"]["start_date"] = (child.text or "").strip() or None
+        elif tag == _END_TAG:
+            context_data["period"]["type"] = "duration"
+            context_data["period"]["end_date"] = (child.text or "").strip() or None
+        elif tag == _FOREVER_TAG:
+            context_data["period"]["type"] = "forever"
+        elif tag == _EXPLICIT_MEMBER_TAG:
+            dimensions.append({
+                "dimension": child.get("dimension"),
+                "type": "explicit",
+                "value": (child.text or "").strip(),
+            })
+        elif tag == _TYPED_MEMBER_TAG:
+            # Typed members carry one arbitrary child element; report its text
+            value = "".join(child.itertext()).strip()
+            dimensions.append({
+                "dimension": child.get("dimension"),
+                "type": "typed",
+                "value": value,
+            })
+
+    if dimensions:
+        context_data["dimensions"] = dimensions
+
+    return context_data
+
+
+def _parse_unit(elem: etree._Element) -> Dict[str, Any]:
+    """Build the unit dict (simple or divide) from a completed element."""
+    unit_data: Dict[str, Any] = {"id": elem.get("id")}
+
+    divide = elem.find(_DIVIDE_TAG)
+    if divide is not None:
+        numerator = [
+            (m.text or "").strip()
+            for m in divide.find(_NUMERATOR_TAG).iter(_MEASURE_TAG)
+        ]
+        denominator = [
+            (m.text or "").strip()
+            for m in divide.find(_DENOMINATOR_TAG).iter(_MEASURE_TAG)
+        ]
+        unit_data["numerator"] = numerator
+        unit_data["denominator"] = denominator
+        unit_data["unit_type"] = "divide"
+        unit_data["numerator_measure"] = numerator[0] if numerator else None
+        unit_data["denominator_measure"] = denominator[0] if denominator else None
+    else:
+        measures = [(m.text or "").strip() for m in elem.iter(_MEASURE_TAG)]
+        unit_data["measures"] = measures
+        unit_data["unit_type"] = "simple"
+        unit_data["measure"] = measures[0] if measures else None
+
+    return unit_data
+
+
+def read_xbrl_instance(content: bytes) -> Dict[str, Any]:
+    """
+    Parse an XBRL instance document into contexts, units, and facts.
+
+    Single streaming pass with iterparse; processed elements are cleared
+    as soon as they're consumed so peak memory stays bounded by the
+    largest single fact, not the document.
+
+    Args:
+        content: Raw bytes of the instance document (.xml / _htm.xml)
+
+    Returns:
+        Dict with "contexts", "units", "facts", and "summary" sections
+        shaped like the corresponding Arelle parser output
+    """
+    contexts: List[Dict[str, Any]] = []
+    units: List[Dict[str, Any]] = []
+    facts: List[Dict[str, Any]] = []
+    prefixes: set = set()
+
+    for _, elem in etree.iterparse(BytesIO(content), events=("end",)):
+        tag = elem.tag
+        if not isinstance(tag, str):
+            continue
+
+        if tag == _CONTEXT_TAG:
+            contexts.append(_parse_context(elem))
+        elif tag == _UNIT_TAG:
+            units.append(_parse_unit(elem))
+        else:
+            context_ref = elem.get("contextRef")
+            if context_ref is None:
+                continue
+            namespace = elem.tag.rsplit("}", 1)[0].lstrip("{")
+            if namespace in _NON_FACT_NAMESPACES:
+                continue
+
+            local_name = tag.rsplit("}", 1)[1]
+            prefix = elem.prefix
+            if prefix:
+                prefixes.add(prefix)
+
+            fact_data: Dict[str, Any] = {
+                "concept": f"{prefix}:{local_name}" if prefix else local_name,
+                "concept_name": local_name,
+                "context_ref": context_ref,
+                "value": elem.text,
+                "unit_ref": elem.get("unitRef"),
+                "is_nil": elem.get(_XSI_NIL) == "true",
+            }
+            decimals = elem.get("decimals")
+            if decimals is not None:
+                fact_data["decimals"] = decimals
+            fact_id = elem.get("id")
+            if fact_id:
+                fact_data["html_anchor_id"] = fact_id
+            facts.append(fact_data)
+        # Contexts/units are parsed above before the clear; facts keep no
+        # reference to the element, so everything consumed can be dropped
+        elem.clear()
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+
+    # Attach period, entity, and dimension info to facts by context,
+    # built once per context rather than once per fact
+    ctx_index = {ctx["id"]: ctx for ctx in contexts}
+    for fact_data in facts:
+        ctx = ctx_index.get(fact_data["context_ref"])
+        if ctx is None:
+            continue
+        fact_data["period"] = ctx["period"]
+        entity = ctx.get("entity")
+        if entity:
+            fact_data["entity_scheme"] = entity["scheme"]
+            fact_data["entity_identifier"] = entity["identifier"]
+        dims = ctx.get("dimensions")
+        if dims:
+            fact_data["dimensions"] = dims
+
+    return {
+        "contexts": contexts,
+        "units": units,
+        "facts": facts,
+        "summary": {
+            "total_facts": len(facts),
+            "total_contexts": len(contexts),
+            "total_units": len(units),
+            "namespaces": sorted(prefixes),
+        },
+    }
+
+
+async def fetch_instance_facts(
+    xbrl_url: str,
+    user_agent_name: str | None = None,
+    user_agent_email: str | None = None,
+) -> Dict[str, Any]:
+    """
+    Fetch and parse an XBRL instance document without Arelle.
+
+    Use this when only the reported values are needed; for labels,
+    concepts, or linkbase relationships, use
+    :meth:`XBRLParserService.parse_xbrl_from_url`.
+
+    Args:
+        xbrl_url: URL to the XBRL instance document (.xml or _htm.xml)
+        user_agent_name: SEC User-Agent name (falls back to settings)
+        user_agent_email: SEC User-Agent email (falls back to settings)
+
+    Returns:
+        Dict with "contexts", "units", "facts", and "summary" sections
+    """
+    headers = _build_headers(user_agent_name, user_agent_email)
+    content = await _fetch(_get_client(), xbrl_url, headers)
+    result = read_xbrl_instance(content)
+    logger.info(
+        "Streamed %d facts from %s", result["summary"]["total_facts"], xbrl_url
+    )
+    return result
@@ -0,0 +1,277 @@
+"""
+Lightweight Role-Definition Extraction
+
+Pulls role definitions out of an XBRL filing with httpx + lxml only,
+without loading the full taxonomy DTS through Arelle. Use this when the
+only outputs needed are role definitions / statement descriptions —
+Arelle's full model load downloads and resolves every referenced schema,
+which is orders of magnitude more work than the handful of documents
+actually touched here (instance, extension schema, presentation linkbase).
+"""
+import hashlib
+import logging
+import os
+import re
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urljoin
+
+import httpx
+from lxml import etree
+
+from sec_pipeline.config import parse_role_definition
+
+logger = logging.getLogger(__name__)
+
+NS = {
+    "link": "http://www.xbrl.org/2003/linkbase",
+    "xlink": "http://www.w3.org/1999/xlink",
+}
+
+_XLINK_HREF = f"{{{NS['xlink']}}}href"
+_XLINK_ROLE = f"{{{NS['xlink']}}}role"
+
+_SCHEMA_REF_TAG = f"{{{NS['link']}}}schemaRef"
+_ROLE_TYPE_TAG = f"{{{NS['link']}}}roleType"
+_LINKBASE_REF_TAG = f"{{{NS['link']}}}linkbaseRef"
+_PRES_LINK_TAG = f"{{{NS['link']}}}presentationLink"
+
+# Role URIs excluded from statement-description output. A single compiled
+# alternation scans each URI once, however many exclusion patterns are
+# listed — add new patterns here rather than chaining `in` checks.
+_EXCLUDED_URI_PATTERNS = ("parenthetical", "details", "tables", "policies")
+_EXCLUDE_URI_RE = re.compile(
+    "|".join(map(re.escape, _EXCLUDED_URI_PATTERNS)), re.IGNORECASE
+)
+
+# Precompiled, namespace-aware XPath for the one child lookup that remains
+# after the move to iterparse. Compiling once at module scope avoids
+# re-parsing the path string on every roleType element evaluated.
+_XP_DEFINITION = etree.XPath("./link:definition/text()", namespaces=NS)
+
+
+def _iter_tags(content: bytes, *tags: str) -> Iterator[etree._Element]:
+    """
+    Stream matching elements out of a document with iterparse.
+
+    Elements are cleared (and processed siblings dropped) as soon as the
+    caller has consumed them, so peak memory stays O(single element)
+    instead of O(document) — instance documents can run to megabytes.
+    """
+    for _, elem in etree.iterparse(BytesIO(content), events=("end",), tag=tags):
+        yield elem
+        elem.clear()
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+
+
+def _build_headers(
+    user_agent_name: str | None = None,
+    user_agent_email: str | None = None,
+) -> Dict[str, str]:
+    """Build SEC-compliant request headers, falling back to settings."""
+    if user_agent_name is None or user_agent_email is None:
+        from sec_pipeline.core.config import settings
+        user_agent_name = user_agent_name or settings.SEC_USER_AGENT_NAME
+        user_agent_email = user_agent_email or settings.SEC_USER_AGENT_EMAIL
+
+    return {
+        "User-Agent": f"{user_agent_name} {user_agent_email}",
+        "Accept-Encoding": "gzip, deflate",
+    }
+
+
+# On-disk cache for fetched documents, keyed by URL. Schemas and linkbases
+# are immutable once published, so repeat runs (and batches of filings
+# processed in the same container) skip the network entirely. Point
+# SEC_XBRL_CACHE_DIR at a persistent volume to share the cache across runs.
+_CACHE_DIR = Path(os.environ.get("SEC_XBRL_CACHE_DIR", "/tmp/xbrl_cache"))
+
+
+# Shared keep-alive client. Each filing triggers one instance + one schema
+# + N linkbase GETs against the same SEC hosts, so reusing connections
+# (and multiplexing over HTTP/2) avoids a TLS handshake per request.
+# Lazily constructed so importing the module never opens sockets.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=30,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=8),
+        )
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared HTTP client (e.g. at worker shutdown)."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+
+
+async def _fetch(client: httpx.AsyncClient, url: str, headers: Dict[str, str]) -> bytes:
+    """Fetch a document, raising on HTTP errors. Caches responses on disk."""
+    cache_path = _CACHE_DIR / hashlib.sha1(url.encode("utf-8")).hexdigest()
+    if cache_path.exists():
+        return cache_path.read_bytes()
+
+    response = await client.get(url, headers=headers)
+    response.raise_for_status()
+    content = response.content
+
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        # Cache is best-effort; a read-only filesystem shouldn't fail the fetch
+        logger.warning(f"Failed to cache {url}: {e}")
+
+    return content
+
+
+async def fetch_role_definitions(
+    xbrl_url: str,
+    user_agent_name: str | None = None,
+    user_agent_email: str | None = None,
+) -> List[Dict[str, Any]]:
+    """
+    Extract role definitions from an XBRL filing without Arelle.
+
+    Fetches the instance document, follows its schemaRef to the extension
+    schema, and reads ``link:roleType`` definitions directly. Roles are
+    restricted to those active in the presentation linkbase when one is
+    referenced from the schema (mirroring what the Arelle-based
+    ``_extract_role_definitions`` reports).
+
+    Args:
+        xbrl_url: URL to the XBRL instance document (.xml or _htm.xml)
+        user_agent_name: SEC User-Agent name (falls back to settings)
+        user_agent_email: SEC User-Agent email (falls back to settings)
+
+    Returns:
+        List of role definition dicts with role_uri, definition,
+        category, and description keys
+    """
+    headers = _build_headers(user_agent_name, user_agent_email)
+    client = _get_client()
+
+    instance_bytes = await _fetch(client, xbrl_url, headers)
+
+    # Follow schemaRef(s) to the extension schema — role definitions
+    # live there, not in the instance
+    schema_urls = []
+    for elem in _iter_tags(instance_bytes, _SCHEMA_REF_TAG):
+        href = elem.get(_XLINK_HREF)
+        if href:
+            schema_urls.append(urljoin(xbrl_url, href))
+
+    definitions: Dict[str, Optional[str]] = {}
+    linkbase_urls: List[str] = []
+
+    for schema_url in schema_urls:
+        try:
+            schema_bytes = await _fetch(client, schema_url, headers)
+        except httpx.HTTPError as e:
+            logger.warning(f"Failed to fetch schema {schema_url}: {e}")
+            continue
+
+        for elem in _iter_tags(schema_bytes, _ROLE_TYPE_TAG, _LINKBASE_REF_TAG):
+            if elem.tag == _ROLE_TYPE_TAG:
+                role_uri = elem.get("roleURI")
+                if not role_uri:
+                    continue
+                definition_texts = _XP_DEFINITION(elem)
+                definitions[role_uri] = (
+                    definition_texts[0] if definition_texts else None
+                )
+            else:
+                lb_href = elem.get(_XLINK_HREF)
+                if lb_href:
+                    linkbase_urls.append(urljoin(schema_url, lb_href))
+
+    # Restrict to roles active in the presentation linkbase
+    active_roles = set()
+    for linkbase_url in linkbase_urls:
+        try:
+            linkbase_bytes = await _fetch(client, linkbase_url, headers)
+        except httpx.HTTPError as e:
+            logger.warning(f"Failed to fetch linkbase {linkbase_url}: {e}")
+            continue
+        for elem in _iter_tags(linkbase_bytes, _PRES_LINK_TAG):
+            role = elem.get(_XLINK_ROLE)
+            if role:
+                active_roles.add(role)
+
+    # Without a presentation linkbase, fall back to every defined role
+    if not active_roles:
+        active_roles = set(definitions)
+
+    role_definitions = []
+    for role_uri in sorted(active_roles):
+        definition = definitions.get(role_uri)
+
+        role_data = {
+            "role_uri": role_uri,
+            "definition": definition,
+            "category": None,
+            "description": None,
+        }
+
+        if definition:
+            parsed = parse_role_definition(definition)
+            if parsed is not None:
+                role_data["category"] = parsed[0]
+                role_data["description"] = parsed[1]
+
+        role_definitions.append(role_data)
+
+    logger.info(f"Extracted {len(role_definitions)} role definitions from {xbrl_url}")
+    return role_definitions
+
+
+async def fetch_statement_descriptions(
+    xbrl_url: str,
+    user_agent_name: str | None = None,
+    user_agent_email: str | None = None,
+) -> List[str]:
+    """
+    Extract unique statement descriptions from an XBRL filing.
+
+    Convenience wrapper over :func:`fetch_role_definitions` that returns
+    just the parsed description strings, skipping parenthetical, detail,
+    table, and policy roles.
+
+    Args:
+        xbrl_url: URL to the XBRL instance document
+        user_agent_name: SEC User-Agent name (falls back to settings)
+        user_agent_email: SEC User-Agent email (falls back to settings)
+
+    Returns:
+        Sorted list of unique role descriptions
+    """
+    role_definitions = await fetch_role_definitions(
+        xbrl_url, user_agent_name, user_agent_email
+    )
+
+    # Collect straight into a set and sort once on return — deduplicates in
+    # one pass and keeps the output deterministic across workers
+    descriptions = set()
+    for role_data in role_definitions:
+        if _EXCLUDE_URI_RE.search(role_data["role_uri"]):
+            continue
+        if role_data["description"]:
+            descriptions.add(role_data["description"])
+
+    return sorted(descriptions)
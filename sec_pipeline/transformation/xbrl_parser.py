@@ -1,12 +1,73 @@
+import asyncio
 import logging
+import os
 import re
 import html
-from typing import Any, Dict, List
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List
+
+import orjson
 from arelle import Cntlr, XbrlConst
 from arelle.ModelXbrl import ModelXbrl
 
 logger = logging.getLogger(__name__)
 
+# Per-worker parser for parse_many: each pool process builds one Arelle
+# controller on first use and reuses it (with its warmed taxonomy cache)
+# for every filing routed to that worker.
+_worker_parser: "XBRLParserService | None" = None
+
+
+def _parse_one(
+    url: str,
+    user_agent_name: str | None,
+    user_agent_email: str | None,
+    cache_dir: str | None,
+) -> Dict[str, Any]:
+    """Parse one filing in a pool worker (module-level so it's picklable)."""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = XBRLParserService(
+            user_agent_name=user_agent_name,
+            user_agent_email=user_agent_email,
+            cache_dir=cache_dir,
+        )
+    return asyncio.run(_worker_parser.parse_xbrl_from_url(url))
+
+
+# Compiled once; strip_html runs per text fact (thousands per filing), so
+# skip re's per-call pattern-cache lookup
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# Section presets for parse_xbrl_from_url. FULL_SECTIONS keeps the
+# original everything-at-once contract; FACTS_ONLY skips the taxonomy and
+# linkbase extractors (the bulk of the work) for ingest jobs that only
+# consume reported values.
+FULL_SECTIONS = frozenset({
+    "document_info",
+    "contexts",
+    "units",
+    "facts",
+    "concepts",
+    "labels",
+    "role_definitions",
+    "presentation_relationships",
+    "calculation_relationships",
+    "definition_relationships",
+    "summary",
+})
+FACTS_ONLY = frozenset({"document_info", "contexts", "units", "facts", "summary"})
+
+
+def _unescape(text):
+    """Decode HTML entities, skipping the scan when none can be present.
+
+    Most labels contain no entities, so the C-level '&' containment check
+    avoids html.unescape's regex walk for the common case.
+    """
+    return html.unescape(text) if text and '&' in text else text
+
 
 def strip_html(text: str) -> str:
     """
@@ -21,18 +82,25 @@ def strip_html(text: str) -> str:
     if not isinstance(text, str):
         return text
 
-    # Decode HTML entities first (e.g., &nbsp;, &lt;, &gt;)
-    text = html.unescape(text)
-
-    # Remove HTML tags using regex
-    # This handles most common cases without requiring BeautifulSoup dependency
-    text = re.sub(r'<[^>]+>', '', text)
-
-    # Clean up extra whitespace that may result from tag removal
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
-
-    return text
+    # Large text-block facts (10-K notes can be hundreds of KB of markup)
+    # go through lxml's C parser: single-pass, and correct for '>' inside
+    # attribute values where the regex would over-strip
+    if len(text) > 256 and '<' in text:
+        try:
+            from lxml import html as lxml_html
+            stripped = lxml_html.fragment_fromstring(
+                text, create_parent=True
+            ).text_content()
+            return _WS_RE.sub(' ', stripped).strip()
+        except Exception:
+            # Malformed markup — fall through to the regex path
+            pass
+
+    # Decode HTML entities first (e.g., &nbsp;, &lt;, &gt;), then remove
+    # tags — handles most common cases without a BeautifulSoup dependency —
+    # and collapse the whitespace left behind by tag removal
+    text = _TAG_RE.sub('', _unescape(text))
+    return _WS_RE.sub(' ', text).strip()
 
 
 class XBRLParserService:
@@ -42,11 +110,21 @@ class XBRLParserService:
         self,
         user_agent_name: str | None = None,
         user_agent_email: str | None = None,
+        cache_dir: str | None = None,
     ):
         # Initialize Arelle controller (headless, no GUI)
         self.controller = Cntlr.Cntlr(logFileName="logToStdErr")
         self.controller.webCache.timeout = 60
 
+        # Point Arelle's web cache at a persistent directory so the
+        # US-GAAP/DEI taxonomy schemas (identical across filings) are
+        # downloaded once and reused by every subsequent parse. Point
+        # SEC_XBRL_TAXONOMY_CACHE_DIR at a mounted volume to share the
+        # cache across containers.
+        cache_dir = cache_dir or os.environ.get("SEC_XBRL_TAXONOMY_CACHE_DIR")
+        if cache_dir:
+            self.controller.webCache.cacheDir = cache_dir
+
         # Accept explicit values; fall back to settings (which reads env vars / .env)
         if user_agent_name is None or user_agent_email is None:
             from sec_pipeline.core.config import settings
@@ -56,17 +134,49 @@ class XBRLParserService:
         # Configure User-Agent for SEC compliance
         user_agent = f"{user_agent_name} {user_agent_email}"
         self.controller.webCache.userAgentHeader = user_agent
+
+        # Kept for parse_many, which re-creates the service in pool workers
+        self._user_agent_name = user_agent_name
+        self._user_agent_email = user_agent_email
+        self._cache_dir = cache_dir
+
+        # Per-parse memo of str(qname); cleared after each document so
+        # id() keys can never outlive the QName objects they refer to
+        self._qname_str_cache: Dict[int, str] = {}
+        # Memoized domain-member subtrees, keyed (concept_key, role_uri);
+        # reset per parse in _extract_definition_relationships
+        self._dm_subtree_cache: Dict[Any, Any] = {}
+
         logger.info(f"Initialized Arelle XBRL parser with User-Agent: {user_agent}")
 
-    async def parse_xbrl_from_url(self, url: str) -> Dict[str, Any]:
+    def close(self) -> None:
+        """
+        Shut down the Arelle controller and release its resources.
+
+        Guarded so teardown never raises if construction failed partway
+        (an Arelle init error would otherwise be masked by an
+        AttributeError here) and is safe to call more than once.
+        """
+        controller = getattr(self, "controller", None)
+        if controller is not None:
+            controller.close()
+            self.controller = None
+
+    async def parse_xbrl_from_url(
+        self, url: str, sections: frozenset = FULL_SECTIONS
+    ) -> Dict[str, Any]:
         """
         Parse an XBRL instance document from a URL using Arelle.
 
         Args:
             url: URL to the XBRL instance document (.xml or _htm.xml for inline)
+            sections: Which output sections to build (default: everything).
+                Pass FACTS_ONLY to skip the taxonomy/linkbase extractors
+                when only reported values are needed — they account for
+                most of the extraction work.
 
         Returns:
-            Dict containing all extracted XBRL data in JSON format
+            Dict containing the requested XBRL data sections in JSON format
         """
         model_xbrl = None
         try:
@@ -86,7 +196,7 @@ class XBRLParserService:
             logger.info(f"Found {len(model_xbrl.facts)} facts, {len(model_xbrl.contexts)} contexts, {len(model_xbrl.units)} units")
 
             # Extract all data into a structured format
-            result = self._extract_all_data(model_xbrl)
+            result = self._extract_all_data(model_xbrl, sections)
 
             return result
 
@@ -94,44 +204,184 @@ class XBRLParserService:
             logger.error(f"Error parsing XBRL document: {type(e).__name__}: {str(e)}")
             raise
         finally:
-            # Clean up - close the model
+            # Clean up - close the model, and drop the id()-keyed qname
+            # memo with it so entries never outlive the model's QNames
+            self._qname_str_cache.clear()
             if model_xbrl is not None:
                 model_xbrl.close()
 
-    def _extract_all_data(self, model_xbrl: ModelXbrl) -> Dict[str, Any]:
+    async def parse_many(
+        self,
+        urls: List[str],
+        workers: int | None = None,
+    ) -> List[Dict[str, Any] | BaseException]:
+        """
+        Parse several filings concurrently across a process pool.
+
+        Arelle parsing is CPU-bound and GIL-bound, so fanning out to
+        processes lets N cores work on N filings. Each worker builds its
+        own controller once and reuses it for every filing it receives.
+
+        Args:
+            urls: XBRL instance document URLs
+            workers: Pool size (defaults to the CPU count)
+
+        Returns:
+            Results in input order; failed parses appear as the raised
+            exception rather than aborting the whole batch
+        """
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            tasks = [
+                loop.run_in_executor(
+                    pool,
+                    _parse_one,
+                    url,
+                    self._user_agent_name,
+                    self._user_agent_email,
+                    self._cache_dir,
+                )
+                for url in urls
+            ]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def parse_xbrl_from_url_to_file(self, url: str, out_path: str) -> Dict[str, Any]:
         """
-        Extract all data from an Arelle ModelXbrl instance into a JSON-serializable format.
+        Parse an XBRL instance document and stream the result to a JSON file.
+
+        Facts — by far the largest section for big filings — are written
+        record by record instead of being materialized as one list, so
+        peak memory stays bounded. The other sections are built as usual.
+
+        Args:
+            url: URL to the XBRL instance document
+            out_path: Path of the JSON file to write
+
+        Returns:
+            The summary section (counts), for logging/bookkeeping
+        """
+        model_xbrl = None
+        try:
+            logger.info(f"Loading XBRL document from: {url}")
+            model_xbrl = self.controller.modelManager.load(url)
+
+            if model_xbrl is None:
+                raise ValueError("Failed to load XBRL document")
+            if model_xbrl.modelDocument is None:
+                raise ValueError("XBRL document has no model document")
+
+            summary = self._generate_summary(model_xbrl)
+
+            with open(out_path, "wb") as out:
+                out.write(b'{"facts":[')
+                first = True
+                for fact_data in self._iter_facts(model_xbrl):
+                    if not first:
+                        out.write(b",")
+                    out.write(orjson.dumps(fact_data, default=str))
+                    first = False
+                out.write(b"]")
+
+                sections = {
+                    "document_info": self._extract_document_info(model_xbrl),
+                    "contexts": self._extract_contexts(model_xbrl),
+                    "units": self._extract_units(model_xbrl),
+                    "concepts": self._extract_concepts(model_xbrl),
+                    "labels": self._extract_labels(model_xbrl),
+                    "role_definitions": self._extract_role_definitions(model_xbrl),
+                    "presentation_relationships": self._extract_presentation_relationships(model_xbrl),
+                    "calculation_relationships": self._extract_calculation_relationships(model_xbrl),
+                    "definition_relationships": self._extract_definition_relationships(model_xbrl),
+                    "summary": summary,
+                }
+                for key, value in sections.items():
+                    out.write(f',"{key}":'.encode())
+                    out.write(orjson.dumps(value, default=str))
+                out.write(b"}")
+
+            logger.info(f"Wrote parsed XBRL data to {out_path}")
+            return summary
+
+        except Exception as e:
+            logger.error(f"Error parsing XBRL document: {type(e).__name__}: {str(e)}")
+            raise
+        finally:
+            self._qname_str_cache.clear()
+            if model_xbrl is not None:
+                model_xbrl.close()
+
+    def _qn(self, qname) -> str:
+        """
+        Stringify a QName through a per-parse memo.
+
+        The same QName objects are stringified over and over across the
+        fact, context, and concept loops; each str() call formats
+        prefix:localName afresh. Keyed by id() — safe only because every
+        entry point that loads a model clears the cache in its finally,
+        before the model (and its QNames) is released; a stale entry
+        could otherwise alias a recycled address from a previous filing.
+        """
+        return self._qname_str_cache.setdefault(id(qname), str(qname))
+
+    @staticmethod
+    def _build_period(context) -> Dict[str, Any]:
+        """Build the period dict for a context (instant/duration/forever)."""
+        period_info: Dict[str, Any] = {}
+        if context.isInstantPeriod:
+            period_info["type"] = "instant"
+            period_info["instant"] = str(context.instantDatetime) if context.instantDatetime else None
+        elif context.isStartEndPeriod:
+            period_info["type"] = "duration"
+            period_info["start_date"] = str(context.startDatetime) if context.startDatetime else None
+            period_info["end_date"] = str(context.endDatetime) if context.endDatetime else None
+        elif context.isForeverPeriod:
+            period_info["type"] = "forever"
+        return period_info
+
+    def _extract_all_data(
+        self, model_xbrl: ModelXbrl, sections: frozenset = FULL_SECTIONS
+    ) -> Dict[str, Any]:
+        """
+        Extract data from an Arelle ModelXbrl instance into a JSON-serializable format.
 
         Args:
             model_xbrl: Loaded Arelle ModelXbrl instance
+            sections: Which output sections to build
 
         Returns:
-            Dict containing all facts, contexts, units, taxonomy metadata, and relationships
+            Dict containing the requested sections (facts, contexts, units,
+            taxonomy metadata, relationships)
         """
-        result = {
+        extractors = (
             # Document metadata
-            "document_info": self._extract_document_info(model_xbrl),
+            ("document_info", self._extract_document_info),
 
             # Instance data (the actual reported values)
-            "contexts": self._extract_contexts(model_xbrl),
-            "units": self._extract_units(model_xbrl),
-            "facts": self._extract_facts(model_xbrl),
+            ("contexts", self._extract_contexts),
+            ("units", self._extract_units),
+            ("facts", self._extract_facts),
 
             # Taxonomy metadata (structure and definitions)
-            "concepts": self._extract_concepts(model_xbrl),
-            "labels": self._extract_labels(model_xbrl),
-            "role_definitions": self._extract_role_definitions(model_xbrl),
+            ("concepts", self._extract_concepts),
+            ("labels", self._extract_labels),
+            ("role_definitions", self._extract_role_definitions),
 
             # Relationship linkbases (how things connect)
-            "presentation_relationships": self._extract_presentation_relationships(model_xbrl),
-            "calculation_relationships": self._extract_calculation_relationships(model_xbrl),
-            "definition_relationships": self._extract_definition_relationships(model_xbrl),
+            ("presentation_relationships", self._extract_presentation_relationships),
+            ("calculation_relationships", self._extract_calculation_relationships),
+            ("definition_relationships", self._extract_definition_relationships),
 
             # Summary statistics
-            "summary": self._generate_summary(model_xbrl)
-        }
+            ("summary", self._generate_summary),
+        )
 
-        return result
+        # The qname memo populated here is cleared by the caller's finally
+        # once the model is released
+        return {
+            name: extract(model_xbrl)
+            for name, extract in extractors
+            if name in sections
+        }
 
     def _extract_document_info(self, model_xbrl: ModelXbrl) -> Dict[str, Any]:
         """Extract document-level metadata."""
@@ -162,30 +412,19 @@ class XBRLParserService:
                     "identifier": context.entityIdentifier[1],
                     "scheme": context.entityIdentifier[0]
                 },
-                "period": {}
+                "period": self._build_period(context)
             }
 
-            # Extract period information
-            if context.isInstantPeriod:
-                context_data["period"]["type"] = "instant"
-                context_data["period"]["instant"] = str(context.instantDatetime) if context.instantDatetime else None
-            elif context.isStartEndPeriod:
-                context_data["period"]["type"] = "duration"
-                context_data["period"]["start_date"] = str(context.startDatetime) if context.startDatetime else None
-                context_data["period"]["end_date"] = str(context.endDatetime) if context.endDatetime else None
-            elif context.isForeverPeriod:
-                context_data["period"]["type"] = "forever"
-
             # Extract dimensions (explicit and typed members)
             dimensions = []
             if hasattr(context, 'qnameDims') and context.qnameDims:
                 for dim_qname, dim_value in context.qnameDims.items():
                     dim_data = {
-                        "dimension": str(dim_qname),
+                        "dimension": self._qn(dim_qname),
                         "type": "explicit" if hasattr(dim_value, 'memberQname') else "typed"
                     }
                     if hasattr(dim_value, 'memberQname'):
-                        dim_data["value"] = str(dim_value.memberQname)
+                        dim_data["value"] = self._qn(dim_value.memberQname)
                     elif hasattr(dim_value, 'typedMember'):
                         dim_data["value"] = str(dim_value.typedMember.stringValue) if hasattr(dim_value.typedMember, 'stringValue') else str(dim_value.typedMember)
                     dimensions.append(dim_data)
@@ -201,6 +440,13 @@ class XBRLParserService:
         """Extract all units from the XBRL instance."""
         units = []
 
+        # Filings reuse a handful of measures (USD, shares, pure) across
+        # all their units; intern the string form per measure object
+        _measure_cache: Dict[int, str] = {}
+
+        def _measure_str(m) -> str:
+            return _measure_cache.setdefault(id(m), str(m))
+
         for unit_id, unit in model_xbrl.units.items():
             unit_data = {
                 "id": unit_id,
@@ -214,18 +460,18 @@ class XBRLParserService:
             if hasattr(unit, 'measures'):
                 if len(unit.measures) == 2 and unit.measures[1]:
                     # Divide unit (e.g., USD/share) — denominator is non-empty
-                    unit_data["numerator"] = [str(m) for m in unit.measures[0]]
-                    unit_data["denominator"] = [str(m) for m in unit.measures[1]]
+                    unit_data["numerator"] = [_measure_str(m) for m in unit.measures[0]]
+                    unit_data["denominator"] = [_measure_str(m) for m in unit.measures[1]]
                     unit_data["unit_type"] = "divide"
-                    unit_data["numerator_measure"] = str(unit.measures[0][0]) if unit.measures[0] else None
-                    unit_data["denominator_measure"] = str(unit.measures[1][0]) if unit.measures[1] else None
+                    unit_data["numerator_measure"] = _measure_str(unit.measures[0][0]) if unit.measures[0] else None
+                    unit_data["denominator_measure"] = _measure_str(unit.measures[1][0]) if unit.measures[1] else None
                     del unit_data["measures"]
                 else:
                     # Simple unit — either 1-tuple or 2-tuple with empty denominator
                     numerator = unit.measures[0] if unit.measures else ()
-                    unit_data["measures"] = [str(m) for m in numerator]
+                    unit_data["measures"] = [_measure_str(m) for m in numerator]
                     unit_data["unit_type"] = "simple"
-                    unit_data["measure"] = str(numerator[0]) if numerator else None
+                    unit_data["measure"] = _measure_str(numerator[0]) if numerator else None
 
             units.append(unit_data)
 
@@ -233,7 +479,65 @@ class XBRLParserService:
 
     def _extract_facts(self, model_xbrl: ModelXbrl) -> List[Dict[str, Any]]:
         """Extract all facts from the XBRL instance."""
-        facts = []
+        return list(self._iter_facts(model_xbrl))
+
+    def _build_fact_dimensions(self, context) -> List[Dict[str, Any]]:
+        """Build the fact-style dimension list for a context."""
+        dimensions: List[Dict[str, Any]] = []
+        if hasattr(context, 'qnameDims') and context.qnameDims:
+            for dim_qname, dim_value in context.qnameDims.items():
+                if dim_qname is None or dim_value is None:
+                    continue
+
+                try:
+                    dim_data = {
+                        "axis": self._qn(dim_qname),
+                        "axis_name": dim_qname.localName if hasattr(dim_qname, 'localName') else str(dim_qname),
+                        "type": "explicit" if hasattr(dim_value, 'memberQname') else "typed"
+                    }
+
+                    # Get the member value
+                    if hasattr(dim_value, 'memberQname') and dim_value.memberQname is not None:
+                        dim_data["member"] = self._qn(dim_value.memberQname)
+                        dim_data["member_name"] = dim_value.memberQname.localName if hasattr(dim_value.memberQname, 'localName') else str(dim_value.memberQname)
+
+                        # Try to get human-readable label for the dimension member
+                        if hasattr(dim_value, 'member') and dim_value.member is not None:
+                            try:
+                                member_label = dim_value.member.label(lang="en-US")
+                                if member_label:
+                                    dim_data["member_label"] = member_label
+                            except Exception:
+                                pass
+                    elif hasattr(dim_value, 'typedMember'):
+                        dim_data["value"] = str(dim_value.typedMember.stringValue) if hasattr(dim_value.typedMember, 'stringValue') else str(dim_value.typedMember)
+
+                    dimensions.append(dim_data)
+                except Exception:
+                    # Skip dimensions that cause errors
+                    pass
+
+        return dimensions
+
+    def _iter_facts(self, model_xbrl: ModelXbrl) -> Iterator[Dict[str, Any]]:
+        """
+        Yield fact dicts one at a time.
+
+        Generator form lets parse_xbrl_from_url_to_file write each record
+        and drop it, so peak memory for the facts section is one record
+        instead of the whole list.
+        """
+        # Hundreds of facts share each context; build the period and
+        # entity info once per context instead of once per fact
+        period_index: Dict[str, Dict[str, Any]] = {}
+        entity_index: Dict[str, Any] = {}
+        dims_index: Dict[str, List[Dict[str, Any]]] = {}
+
+        # One walk over the conceptLabel relationship set replaces two
+        # label-set walks per fact
+        label_idx = self._build_label_index(model_xbrl)
+        STANDARD = XbrlConst.standardLabel
+        TERSE = XbrlConst.terseLabel
 
         for fact in model_xbrl.facts:
             raw_value = fact.value
@@ -241,13 +545,15 @@ class XBRLParserService:
             if isinstance(value, str):
                 value = strip_html(value)
 
+            # ModelFact always defines these attributes, so single getattr
+            # reads replace the hasattr-then-read double lookups
             fact_data = {
-                "concept": str(fact.qname),
+                "concept": self._qn(fact.qname),
                 "concept_name": fact.qname.localName,
                 "context_ref": fact.contextID,
                 "value": value,
-                "unit_ref": fact.unitID if hasattr(fact, 'unitID') and fact.unitID else None,
-                "is_nil": fact.isNil if hasattr(fact, 'isNil') else False,
+                "unit_ref": getattr(fact, 'unitID', None) or None,
+                "is_nil": getattr(fact, 'isNil', False),
             }
 
             # Preserve raw HTML for text block values (tables, formatted notes)
@@ -258,130 +564,170 @@ class XBRLParserService:
             # This makes it easier to understand what makes each fact unique
             if fact.context is not None:
                 context = fact.context
+                context_id = fact.contextID
 
-                # Add period information
-                period_info = {}
-                if context.isInstantPeriod:
-                    period_info["type"] = "instant"
-                    period_info["instant"] = str(context.instantDatetime) if context.instantDatetime else None
-                elif context.isStartEndPeriod:
-                    period_info["type"] = "duration"
-                    period_info["start_date"] = str(context.startDatetime) if context.startDatetime else None
-                    period_info["end_date"] = str(context.endDatetime) if context.endDatetime else None
-                elif context.isForeverPeriod:
-                    period_info["type"] = "forever"
-
+                # Add period information (shared across facts of a context)
+                period_info = period_index.get(context_id)
+                if period_info is None:
+                    period_info = period_index[context_id] = self._build_period(context)
                 fact_data["period"] = period_info
 
                 # Add entity information from context
-                if hasattr(context, 'entityIdentifier') and context.entityIdentifier:
-                    fact_data["entity_scheme"] = context.entityIdentifier[0]
-                    fact_data["entity_identifier"] = context.entityIdentifier[1]
-
-                # Add dimension information
-                dimensions = []
-                if hasattr(context, 'qnameDims') and context.qnameDims:
-                    for dim_qname, dim_value in context.qnameDims.items():
-                        if dim_qname is None or dim_value is None:
-                            continue
-
-                        try:
-                            dim_data = {
-                                "axis": str(dim_qname),
-                                "axis_name": dim_qname.localName if hasattr(dim_qname, 'localName') else str(dim_qname),
-                                "type": "explicit" if hasattr(dim_value, 'memberQname') else "typed"
-                            }
-
-                            # Get the member value
-                            if hasattr(dim_value, 'memberQname') and dim_value.memberQname is not None:
-                                dim_data["member"] = str(dim_value.memberQname)
-                                dim_data["member_name"] = dim_value.memberQname.localName if hasattr(dim_value.memberQname, 'localName') else str(dim_value.memberQname)
-
-                                # Try to get human-readable label for the dimension member
-                                if hasattr(dim_value, 'member') and dim_value.member is not None:
-                                    try:
-                                        member_label = dim_value.member.label(lang="en-US")
-                                        if member_label:
-                                            dim_data["member_label"] = member_label
-                                    except Exception:
-                                        pass
-                            elif hasattr(dim_value, 'typedMember'):
-                                dim_data["value"] = str(dim_value.typedMember.stringValue) if hasattr(dim_value.typedMember, 'stringValue') else str(dim_value.typedMember)
-
-                            dimensions.append(dim_data)
-                        except Exception:
-                            # Skip dimensions that cause errors
-                            pass
-
+                entity_identifier = entity_index.get(context_id)
+                if entity_identifier is None:
+                    entity_identifier = entity_index[context_id] = (
+                        getattr(context, 'entityIdentifier', None) or ()
+                    )
+                if entity_identifier:
+                    fact_data["entity_scheme"] = entity_identifier[0]
+                    fact_data["entity_identifier"] = entity_identifier[1]
+
+                # Add dimension information (dims live on the context,
+                # so the list is built once per context, not per fact)
+                dimensions = dims_index.get(context_id)
+                if dimensions is None:
+                    dimensions = dims_index[context_id] = self._build_fact_dimensions(context)
                 if dimensions:
                     fact_data["dimensions"] = dimensions
 
             # Add human-readable label from taxonomy
             # This is the label that appears in financial statements
             if fact.concept is not None:
-                try:
-                    # Try to get standard label (what appears in statements)
-                    standard_label = fact.concept.label(lang="en-US")
-                    if standard_label:
-                        # Decode HTML entities in labels
-                        fact_data["label"] = html.unescape(standard_label)
-
-                    # Also try to get terser label if available (shorter version)
-                    terse_label = fact.concept.label(preferredLabel="http://www.xbrl.org/2003/role/terseLabel", lang="en-US")
-                    if terse_label and terse_label != standard_label:
-                        # Decode HTML entities in labels
-                        fact_data["terse_label"] = html.unescape(terse_label)
-                except Exception:
-                    # Label extraction failed, skip it
-                    pass
+                labels = label_idx.get(fact.qname)
+                if labels:
+                    standard_label = labels.get(STANDARD)
+                    terse_label = labels.get(TERSE)
+                else:
+                    # Index miss (e.g. label bound to a different qname
+                    # object) — fall back to the per-concept walk
+                    try:
+                        standard_label = fact.concept.label(lang="en-US")
+                        terse_label = fact.concept.label(preferredLabel=TERSE, lang="en-US")
+                    except Exception:
+                        standard_label = terse_label = None
+
+                if standard_label:
+                    # Decode HTML entities in labels
+                    fact_data["label"] = _unescape(standard_label)
+                if terse_label and terse_label != standard_label:
+                    fact_data["terse_label"] = _unescape(terse_label)
 
             # Add numeric flag directly from Arelle
             fact_data["is_numeric"] = fact.isNumeric
 
             # Add numeric-specific attributes
             if fact.isNumeric:
-                fact_data["decimals"] = fact.decimals if hasattr(fact, 'decimals') else None
-                fact_data["precision"] = fact.precision if hasattr(fact, 'precision') else None
+                fact_data["decimals"] = getattr(fact, 'decimals', None)
+                fact_data["precision"] = getattr(fact, 'precision', None)
 
             # Add data type
             if fact.concept is not None and hasattr(fact.concept, 'type'):
                 try:
                     if fact.concept.type is not None and hasattr(fact.concept.type, 'qname'):
-                        fact_data["data_type"] = str(fact.concept.type.qname)
+                        fact_data["data_type"] = self._qn(fact.concept.type.qname)
                 except Exception:
                     pass
 
             # Add iXBRL source tracing information (for Inline XBRL files)
             # This allows linking back to the exact location in the SEC filing
-            try:
-                if hasattr(fact, 'id') and fact.id:
-                    fact_data["html_anchor_id"] = fact.id
+            fact_id = getattr(fact, 'id', None)
+            if fact_id:
+                fact_data["html_anchor_id"] = fact_id
 
-                if hasattr(fact, 'sourceline') and fact.sourceline:
-                    fact_data["source_line"] = fact.sourceline
+            source_line = getattr(fact, 'sourceline', None)
+            if source_line:
+                fact_data["source_line"] = source_line
 
-                # Extract source filename from the fact's model document
-                if hasattr(fact, 'modelDocument') and fact.modelDocument is not None:
-                    if hasattr(fact.modelDocument, 'basename'):
-                        fact_data["source_file"] = fact.modelDocument.basename
-            except Exception:
-                # If iXBRL source extraction fails, continue without it
-                pass
+            # Extract source filename from the fact's model document
+            model_document = getattr(fact, 'modelDocument', None)
+            if model_document is not None:
+                source_file = getattr(model_document, 'basename', None)
+                if source_file:
+                    fact_data["source_file"] = source_file
 
-            facts.append(fact_data)
+            yield fact_data
 
-        return facts
+    def extract_facts_columnar(self, model_xbrl: ModelXbrl) -> Dict[str, List[Any]]:
+        """
+        Extract facts as a dict of parallel column lists.
+
+        Downstream filtering and joins work on (concept, context_ref,
+        period end, value); building columns directly feeds
+        pandas.DataFrame(...) or pyarrow.table(...) as contiguous arrays
+        without a per-record dict intermediate.
+
+        Returns:
+            Dict of equal-length lists keyed by column name
+        """
+        try:
+            return self._extract_facts_columnar(model_xbrl)
+        finally:
+            # The model belongs to the caller, so this is its own memo
+            # lifetime: clear before returning rather than relying on a
+            # later parse to do it
+            self._qname_str_cache.clear()
+
+    def _extract_facts_columnar(self, model_xbrl: ModelXbrl) -> Dict[str, List[Any]]:
+        concepts: List[str] = []
+        concept_names: List[str] = []
+        context_refs: List[str] = []
+        values: List[Any] = []
+        unit_refs: List[Any] = []
+        decimals: List[Any] = []
+        is_numeric: List[bool] = []
+        period_starts: List[Any] = []
+        period_ends: List[Any] = []
+        period_instants: List[Any] = []
+
+        qn = self._qn
+        for fact in model_xbrl.facts:
+            concepts.append(qn(fact.qname))
+            concept_names.append(fact.qname.localName)
+            context_refs.append(fact.contextID)
+            value = fact.value
+            values.append(strip_html(value) if isinstance(value, str) else value)
+            unit_refs.append(getattr(fact, 'unitID', None) or None)
+            numeric = fact.isNumeric
+            is_numeric.append(numeric)
+            decimals.append(getattr(fact, 'decimals', None) if numeric else None)
+
+            context = fact.context
+            if context is not None and context.isStartEndPeriod:
+                period_starts.append(str(context.startDatetime) if context.startDatetime else None)
+                period_ends.append(str(context.endDatetime) if context.endDatetime else None)
+                period_instants.append(None)
+            elif context is not None and context.isInstantPeriod:
+                period_starts.append(None)
+                period_ends.append(None)
+                period_instants.append(str(context.instantDatetime) if context.instantDatetime else None)
+            else:
+                period_starts.append(None)
+                period_ends.append(None)
+                period_instants.append(None)
+
+        return {
+            "concept": concepts,
+            "concept_name": concept_names,
+            "context_ref": context_refs,
+            "value": values,
+            "unit_ref": unit_refs,
+            "decimals": decimals,
+            "is_numeric": is_numeric,
+            "period_start": period_starts,
+            "period_end": period_ends,
+            "period_instant": period_instants,
+        }
 
     def _generate_summary(self, model_xbrl: ModelXbrl) -> Dict[str, Any]:
         """Generate summary statistics about the XBRL document."""
-        # Extract unique namespaces from facts
+        # Derived from the facts, not model_xbrl.prefixedNamespaces: that
+        # map covers the whole DTS (xbrli, link, iso4217, ...) including
+        # namespaces no fact uses, so it would change what
+        # summary["namespaces"] means. The deduped fact scan is cheap.
         namespaces = set()
         for fact in model_xbrl.facts:
-            if fact.qname.namespaceURI:
-                # Get the prefix for this namespace
-                prefix = fact.qname.prefix
-                if prefix:
-                    namespaces.add(prefix)
+            if fact.qname.namespaceURI and fact.qname.prefix:
+                namespaces.add(fact.qname.prefix)
 
         return {
             "total_facts": len(model_xbrl.facts),
@@ -390,6 +736,32 @@ class XBRLParserService:
             "namespaces": sorted(list(namespaces))
         }
 
+    def _build_label_index(self, model_xbrl: ModelXbrl) -> Dict[Any, Dict[str, str]]:
+        """
+        Index concept labels by qname and role in one pass.
+
+        concept.label() walks the label relationship set on every call;
+        four roles x thousands of concepts makes that the dominant cost of
+        concept extraction. One walk over the conceptLabel relationships
+        turns each lookup into a dict hit.
+
+        Returns:
+            Dict mapping concept qname -> {label role URI: label text}
+        """
+        label_idx: Dict[Any, Dict[str, str]] = {}
+        for rel in model_xbrl.relationshipSet(XbrlConst.conceptLabel).modelRelationships:
+            resource = rel.toModelObject
+            if resource is None or not resource.text:
+                continue
+            lang = getattr(resource, 'xmlLang', None)
+            if lang and not lang.startswith('en'):
+                continue
+            from_obj = rel.fromModelObject
+            if from_obj is None:
+                continue
+            label_idx.setdefault(from_obj.qname, {})[resource.role] = resource.text
+        return label_idx
+
     def _extract_concepts(self, model_xbrl: ModelXbrl) -> List[Dict[str, Any]]:
         """
         Extract all concepts from the taxonomy.
@@ -404,11 +776,21 @@ class XBRLParserService:
 
         logger.info(f"Extracting {len(model_xbrl.qnameConcepts)} concepts from taxonomy")
 
+        label_idx = self._build_label_index(model_xbrl)
+        no_labels: Dict[str, str] = {}
+
+        # Bind the role constants once; inside the loop they'd cost a
+        # module-dict probe per concept per role
+        STANDARD = XbrlConst.standardLabel
+        TERSE = XbrlConst.terseLabel
+        VERBOSE = XbrlConst.verboseLabel
+        DOC_LABEL = XbrlConst.documentationLabel
+
         for qname, concept in model_xbrl.qnameConcepts.items():
             try:
                 concept_data = {
                     # Identification
-                    "qname": str(qname),
+                    "qname": self._qn(qname),
                     "local_name": qname.localName,
                     "namespace_uri": qname.namespaceURI,
                     "prefix": qname.prefix if hasattr(qname, 'prefix') else None,
@@ -434,39 +816,30 @@ class XBRLParserService:
                     "substitution_group": None,
                 }
 
-                # Extract labels (wrapped in try-except since labels might not exist)
-                try:
-                    standard_label = concept.label(lang="en-US")
-                    if standard_label:
-                        concept_data["standard_label"] = html.unescape(standard_label)
-                except Exception:
-                    pass
+                # Labels come from the prebuilt index — four dict hits
+                # instead of four relationship-set walks per concept
+                labels = label_idx.get(qname, no_labels)
 
-                try:
-                    terse_label = concept.label(preferredLabel=XbrlConst.terseLabel, lang="en-US")
-                    if terse_label:
-                        concept_data["terse_label"] = html.unescape(terse_label)
-                except Exception:
-                    pass
+                standard_label = labels.get(STANDARD)
+                if standard_label:
+                    concept_data["standard_label"] = _unescape(standard_label)
 
-                try:
-                    verbose_label = concept.label(preferredLabel=XbrlConst.verboseLabel, lang="en-US")
-                    if verbose_label:
-                        concept_data["verbose_label"] = html.unescape(verbose_label)
-                except Exception:
-                    pass
+                terse_label = labels.get(TERSE)
+                if terse_label:
+                    concept_data["terse_label"] = _unescape(terse_label)
 
-                try:
-                    documentation = concept.label(preferredLabel=XbrlConst.documentationLabel, lang="en-US")
-                    if documentation:
-                        concept_data["documentation"] = html.unescape(documentation)
-                except Exception:
-                    pass
+                verbose_label = labels.get(VERBOSE)
+                if verbose_label:
+                    concept_data["verbose_label"] = _unescape(verbose_label)
+
+                documentation = labels.get(DOC_LABEL)
+                if documentation:
+                    concept_data["documentation"] = _unescape(documentation)
 
                 # Extract type information
                 try:
                     if hasattr(concept, 'typeQname') and concept.typeQname:
-                        concept_data["data_type"] = str(concept.typeQname)
+                        concept_data["data_type"] = self._qn(concept.typeQname)
                 except Exception:
                     pass
 
@@ -478,7 +851,7 @@ class XBRLParserService:
 
                 try:
                     if hasattr(concept, 'substitutionGroupQname') and concept.substitutionGroupQname:
-                        concept_data["substitution_group"] = str(concept.substitutionGroupQname)
+                        concept_data["substitution_group"] = self._qn(concept.substitutionGroupQname)
                 except Exception:
                     pass
 
@@ -510,7 +883,7 @@ class XBRLParserService:
                 if label_resource is None or not label_resource.text:
                     continue
                 labels.append({
-                    "concept_qname": str(qname),
+                    "concept_qname": self._qn(qname),
                     "label_role": label_resource.role,
                     "label_text": strip_html(label_resource.text),
                     "language": label_resource.xmlLang or "en-US",
@@ -585,13 +958,14 @@ class XBRLParserService:
         logger.info(f"Extracting presentation relationships from {len(all_rels)} relationships")
 
         relationships = []
+        qn = self._qn
 
         for rel in all_rels:
             try:
                 relationships.append({
-                    "parent_concept": str(rel.fromModelObject.qname),
-                    "child_concept": str(rel.toModelObject.qname),
-                    "order": float(rel.order) if rel.order else None,
+                    "parent_concept": qn(rel.fromModelObject.qname),
+                    "child_concept": qn(rel.toModelObject.qname),
+                    "order": float(o) if (o := rel.order) is not None else None,
                     "preferred_label_role": rel.preferredLabel,
                     "role_uri": rel.linkrole,
                     "priority": rel.priority if hasattr(rel, 'priority') else None,
@@ -625,13 +999,14 @@ class XBRLParserService:
         logger.info(f"Extracting calculation relationships from {len(all_rels)} relationships")
 
         calculations = []
+        qn = self._qn
 
         # Iterate all calculation relationships
         for rel in all_rels:
             try:
                 calc_data = {
-                    "total_concept": str(rel.fromModelObject.qname),
-                    "component_concept": str(rel.toModelObject.qname),
+                    "total_concept": qn(rel.fromModelObject.qname),
+                    "component_concept": qn(rel.toModelObject.qname),
                     "weight": float(rel.weight) if hasattr(rel, 'weight') and rel.weight else None,
                     "order": float(rel.order) if hasattr(rel, 'order') and rel.order else None,
                     "role_uri": rel.linkrole if hasattr(rel, 'linkrole') else None,
@@ -647,54 +1022,265 @@ class XBRLParserService:
         return calculations
 
     def _traverse_domain_member_tree(
-        self, rel_set, concept, role_uri: str, depth: int = 0, visited: set = None
+        self, adjacency, concept, role_uri: str, depth: int = 0, ancestors: set = None
     ) -> List[Dict[str, Any]]:
         """
-        Recursively traverse domain-member hierarchy.
+        Traverse a domain-member hierarchy with an explicit stack.
+
+        Cycle detection is strictly ancestor-on-current-path: a concept
+        reachable along several branches (a DAG diamond) is traversed once
+        per path, and descent is pruned only when an edge points back at a
+        concept already on the path from the root — the cycle edge itself
+        is still emitted. The path is a backtracked set rather than a
+        tuple scan so membership stays O(1) at any depth; list entries on
+        the stack are backtrack markers that remove their concept when the
+        traversal leaves its subtree.
+
+        Iterative DFS: no Python frame per edge and no RecursionError on
+        pathologically deep taxonomies.
+
+        Subtrees reached from several parents (diamond topology) are
+        memoized in ``self._dm_subtree_cache`` so each shared subtree is
+        walked once per role instead of once per path. Only subtrees whose
+        traversal hit no cycle prune are cached, and a cached subtree is
+        spliced in only when none of its concepts sit on the current path,
+        so memoized output is identical to the uncached traversal.
 
         Args:
-            rel_set: ModelRelationshipSet for domain-member relationships
-            concept: Current domain/member concept
+            adjacency: Dict mapping concept -> {linkrole: outgoing
+                domain-member relationships} (prebuilt adjacency index)
+            concept: Domain/member concept to start from
             role_uri: Role URI to filter by
-            depth: Current depth (0 = domain root)
-            visited: Set of visited concepts (cycle detection)
+            depth: Starting depth (0 = domain root)
+            ancestors: Concept keys already on the current path; descent
+                into any of them is pruned (cycle detection)
 
         Returns:
             List of domain-member relationship dicts
         """
-        if visited is None:
-            visited = set()
-
-        concept_key = str(concept.qname)
-        if concept_key in visited:
-            return []
-
-        visited.add(concept_key)
-        results = []
-
-        child_rels = rel_set.fromModelObject(concept)
-        for rel in child_rels:
-            if rel.linkrole != role_uri:
+        out: List[Dict[str, Any]] = []
+        path = set() if ancestors is None else ancestors
+        cache = self._dm_subtree_cache
+        qn = self._qn
+
+        root_key = qn(concept.qname)
+        if root_key in path:
+            return out
+        cached = cache.get((root_key, role_uri))
+        if cached is not None and cached[1].isdisjoint(path):
+            return [dict(row, depth=row["depth"] + depth) for row in cached[0]]
+        path.add(root_key)
+
+        prunes = 0
+        # Stack entries are (relationship, parent_depth) tuples, or a
+        # [concept_key, out_start, entry_depth, prunes_at_entry] backtrack
+        # marker that also decides whether the finished subtree is cacheable
+        stack: List[Any] = []
+        root_rels = adjacency.get(concept)
+        if root_rels:
+            for rel in reversed(root_rels.get(role_uri, ())):
+                stack.append((rel, depth))
+
+        while stack:
+            entry = stack.pop()
+            if type(entry) is list:
+                key, start, entry_depth, entry_prunes = entry
+                path.discard(key)
+                if prunes == entry_prunes:
+                    rows = out[start:]
+                    cache[(key, role_uri)] = (
+                        [dict(r, depth=r["depth"] - entry_depth) for r in rows],
+                        frozenset(r["to_concept"] for r in rows) | {key},
+                    )
                 continue
+
+            rel, parent_depth = entry
             child = rel.toModelObject
+            child_key = qn(child.qname)
+            child_depth = parent_depth + 1
 
-            results.append({
-                "from_concept": str(concept.qname),
-                "to_concept": str(child.qname),
+            out.append({
+                "from_concept": qn(rel.fromModelObject.qname),
+                "to_concept": child_key,
                 "relationship_type": "domain-member",
                 "role_uri": role_uri,
-                "order": float(rel.order) if rel.order else None,
-                "depth": depth + 1,
+                "order": float(o) if (o := rel.order) is not None else None,
+                "depth": child_depth,
                 "priority": rel.priority if hasattr(rel, 'priority') else None,
             })
 
-            results.extend(
-                self._traverse_domain_member_tree(
-                    rel_set, child, role_uri, depth + 1, visited.copy()
+            if child_key in path:
+                # Edge recorded, but don't descend into an ancestor
+                prunes += 1
+                continue
+            cached = cache.get((child_key, role_uri))
+            if cached is not None and cached[1].isdisjoint(path):
+                out.extend(
+                    dict(r, depth=r["depth"] + child_depth) for r in cached[0]
                 )
+                continue
+            path.add(child_key)
+            stack.append([child_key, len(out), child_depth, prunes])
+            child_rels = adjacency.get(child)
+            if child_rels:
+                for child_rel in reversed(child_rels.get(role_uri, ())):
+                    stack.append((child_rel, child_depth))
+
+        path.discard(root_key)
+        if prunes == 0:
+            cache[(root_key, role_uri)] = (
+                [dict(r, depth=r["depth"] - depth) for r in out],
+                frozenset(r["to_concept"] for r in out) | {root_key},
             )
+        return out
+
+    def _extract_flat_arcrole(
+        self, rels: List[Any], type_name: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract one flat (non-hierarchical) definition arcrole as a list of rows.
+
+        Takes the already-materialized modelRelationships list — callers
+        resolve the relationship set on the main thread, since first
+        touch mutates Arelle's per-model caches.
+
+        Runs unguarded on the fast path; if any relationship raises, the
+        arcrole is redone under a per-relationship guard so one bad edge
+        doesn't drop its siblings.
+        """
+        qn = self._qn
+        # linkrole and order are mandatory on ModelRelationship, and
+        # closed is always exposed on all/notAll arcs, so resolve the
+        # shape once per arcrole instead of hasattr-probing every rel
+        has_closed = type_name in ("all", "notAll")
+        # Fast path emits exactly one row per relationship, so the batch
+        # is preallocated and index-assigned — no geometric list regrowth
+        batch: List[Dict[str, Any]] = [None] * len(rels)
+        idx = 0
+        try:
+            # Fast path: healthy filings never raise here, so the loop
+            # body carries no per-relationship exception setup
+            for rel in rels:
+                rel_data = {
+                    "from_concept": qn(rel.fromModelObject.qname),
+                    "to_concept": qn(rel.toModelObject.qname),
+                    "relationship_type": type_name,
+                    "role_uri": rel.linkrole,
+                    "order": float(o) if (o := rel.order) is not None else None,
+                    "priority": getattr(rel, 'priority', None),
+                }
+                if has_closed:
+                    closed = rel.closed
+                    rel_data["is_closed"] = str(closed) if closed else None
+                batch[idx] = rel_data
+                idx += 1
+            del batch[idx:]
+        except Exception:
+            # A malformed relationship: redo this arcrole with a
+            # per-rel guard so one bad edge doesn't drop its siblings
+            batch = []
+            append = batch.append
+            for rel in rels:
+                try:
+                    rel_data = {
+                        "from_concept": qn(rel.fromModelObject.qname),
+                        "to_concept": qn(rel.toModelObject.qname),
+                        "relationship_type": type_name,
+                        "role_uri": rel.linkrole,
+                        "order": float(o) if (o := rel.order) is not None else None,
+                        "priority": getattr(rel, 'priority', None),
+                    }
+                    if has_closed:
+                        closed = rel.closed
+                        rel_data["is_closed"] = str(closed) if closed else None
+                    append(rel_data)
+                except Exception as e:
+                    logger.warning(f"Error extracting definition relationship ({type_name}): {e}")
+                    continue
+        return batch
+
+    def iter_definition_relationships(self, model_xbrl: ModelXbrl) -> Iterator[Dict[str, Any]]:
+        """
+        Yield definition relationships one dict at a time.
+
+        Same rows, same order as _extract_definition_relationships, but
+        rows are produced per arcrole batch and per domain-member tree
+        instead of one flat list — callers that stream (NDJSON sinks,
+        row-by-row loads) never hold the full relationship set in memory.
+
+        Yields:
+            Definition relationship dicts
+        """
+        self._dm_subtree_cache.clear()
+        try:
+            # Flat arcrole types (simple iteration over modelRelationships)
+            flat_arcroles = [
+                (XbrlConst.all, "all"),
+                (XbrlConst.notAll, "notAll"),
+                (XbrlConst.hypercubeDimension, "hypercube-dimension"),
+                (XbrlConst.dimensionDomain, "dimension-domain"),
+                (XbrlConst.dimensionDefault, "dimension-default"),
+            ]
+
+            # relationshipSet() is resolved serially: first touch builds and
+            # caches a ModelRelationshipSet on the model, which Arelle does
+            # not guarantee to be thread-safe. Only the materialized lists go
+            # to the pool; executor.map keeps the arcrole order
+            flat_rels = [
+                (model_xbrl.relationshipSet(arcrole_const).modelRelationships, type_name)
+                for arcrole_const, type_name in flat_arcroles
+            ]
+            with ThreadPoolExecutor(max_workers=len(flat_rels)) as executor:
+                batches = executor.map(
+                    lambda arc: self._extract_flat_arcrole(*arc),
+                    flat_rels,
+                )
+                for batch in batches:
+                    yield from batch
+
+            # Domain-member arcrole (hierarchical, needs tree traversal)
+            dm_rel_set = model_xbrl.relationshipSet(XbrlConst.domainMember)
+            dm_rels = dm_rel_set.modelRelationships
+
+            # One pass over the flat relationships builds an adjacency index
+            # grouped by linkrole, replacing both the per-node fromModelObject
+            # call and the per-role rescan of all outbound edges during traversal
+            adjacency: Dict[Any, Dict[str, List[Any]]] = {}
+            for rel in dm_rels:
+                by_role = adjacency.get(rel.fromModelObject)
+                if by_role is None:
+                    by_role = adjacency[rel.fromModelObject] = {}
+                by_role.setdefault(rel.linkrole, []).append(rel)
+
+            # Traverse from root concepts for each role
+            root_concepts = dm_rel_set.rootConcepts if hasattr(dm_rel_set, 'rootConcepts') else []
+            for root in root_concepts:
+                try:
+                    # The adjacency index is keyed by role, so the roles this
+                    # root participates in are just its outbound-edge keys
+                    for role_uri in adjacency.get(root, ()):
+                        yield from self._traverse_domain_member_tree(
+                            adjacency, root, role_uri, depth=0
+                        )
+                except Exception as e:
+                    logger.warning(f"Error traversing domain-member tree from {root.qname}: {e}")
+                    continue
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Definition linkbase traversal complete (domain-member source: %d raw rels)",
+                    len(dm_rels),
+                )
+        finally:
+            # This is a public streaming entry point for caller-owned
+            # models, so it upholds the same memo-lifetime invariant as
+            # the URL entry points: runs on exhaustion and GeneratorExit,
+            # dropping the id()-keyed qname memo before the model's
+            # QNames can be freed and keeping the last filing's
+            # domain-member rows from staying resident between parses
+            self._qname_str_cache.clear()
+            self._dm_subtree_cache.clear()
 
-        return results
 
     def _extract_definition_relationships(self, model_xbrl: ModelXbrl) -> List[Dict[str, Any]]:
         """
@@ -710,63 +1296,52 @@ class XBRLParserService:
         Returns:
             List of definition relationship dicts
         """
-        relationships = []
+        relationships = list(self.iter_definition_relationships(model_xbrl))
+        logger.info(f"Successfully extracted {len(relationships)} definition relationships")
+        return relationships
 
-        # Flat arcrole types (simple iteration over modelRelationships)
-        flat_arcroles = [
-            (XbrlConst.all, "all"),
-            (XbrlConst.notAll, "notAll"),
-            (XbrlConst.hypercubeDimension, "hypercube-dimension"),
-            (XbrlConst.dimensionDomain, "dimension-domain"),
-            (XbrlConst.dimensionDefault, "dimension-default"),
-        ]
-
-        for arcrole_const, type_name in flat_arcroles:
-            rel_set = model_xbrl.relationshipSet(arcrole_const)
-            for rel in rel_set.modelRelationships:
-                try:
-                    rel_data = {
-                        "from_concept": str(rel.fromModelObject.qname),
-                        "to_concept": str(rel.toModelObject.qname),
-                        "relationship_type": type_name,
-                        "role_uri": rel.linkrole if hasattr(rel, 'linkrole') else None,
-                        "order": float(rel.order) if hasattr(rel, 'order') and rel.order else None,
-                        "priority": rel.priority if hasattr(rel, 'priority') else None,
-                    }
-                    # Capture closed attribute for all/notAll
-                    if type_name in ("all", "notAll") and hasattr(rel, 'closed'):
-                        rel_data["is_closed"] = str(rel.closed) if rel.closed else None
-                    relationships.append(rel_data)
-                except Exception as e:
-                    logger.warning(f"Error extracting definition relationship ({type_name}): {e}")
-                    continue
+    async def parse_definition_relationships_to_ndjson(self, url: str, out_path: str) -> int:
+        """
+        Parse only the definition linkbase of a filing and stream it to NDJSON.
 
-        # Domain-member arcrole (hierarchical, needs tree traversal)
-        dm_rel_set = model_xbrl.relationshipSet(XbrlConst.domainMember)
-        dm_total = len(dm_rel_set.modelRelationships)
+        One JSON object per line — the format Snowflake stage loads ingest
+        natively. Rows are written as they are produced, so memory stays
+        bounded regardless of relationship count.
 
-        # Traverse from root concepts for each role
-        root_concepts = dm_rel_set.rootConcepts if hasattr(dm_rel_set, 'rootConcepts') else []
-        for root in root_concepts:
-            try:
-                # Determine which role(s) this root belongs to
-                child_rels = dm_rel_set.fromModelObject(root)
-                root_roles = set(rel.linkrole for rel in child_rels)
-                for role_uri in root_roles:
-                    relationships.extend(
-                        self._traverse_domain_member_tree(
-                            dm_rel_set, root, role_uri, depth=0
-                        )
-                    )
-            except Exception as e:
-                logger.warning(f"Error traversing domain-member tree from {root.qname}: {e}")
-                continue
+        Args:
+            url: URL to the XBRL instance document
+            out_path: Path of the NDJSON file to write
 
-        logger.info(
-            f"Successfully extracted {len(relationships)} definition relationships "
-            f"(domain-member source: {dm_total} raw rels)"
-        )
-        return relationships
+        Returns:
+            Number of relationships written
+        """
+        model_xbrl = None
+        try:
+            logger.info(f"Loading XBRL document from: {url}")
+            model_xbrl = self.controller.modelManager.load(url)
+
+            if model_xbrl is None:
+                raise ValueError("Failed to load XBRL document")
+            if model_xbrl.modelDocument is None:
+                raise ValueError("XBRL document has no model document")
+
+            count = 0
+            with open(out_path, "wb") as out:
+                for rel_data in self.iter_definition_relationships(model_xbrl):
+                    out.write(orjson.dumps(rel_data, default=str))
+                    out.write(b"\n")
+                    count += 1
+
+            logger.info(f"Wrote {count} definition relationships to {out_path}")
+            return count
+
+        except Exception as e:
+            logger.error(f"Error parsing XBRL document: {type(e).__name__}: {str(e)}")
+            raise
+        finally:
+            self._qname_str_cache.clear()
+            if model_xbrl is not None:
+                model_xbrl.close()
 
 
 _xbrl_parser_service: XBRLParserService | None = None
@@ -783,7 +1358,11 @@ def get_xbrl_parser_service(**kwargs) -> XBRLParserService:
 class _LazyParser:
     """Proxy that defers XBRLParserService construction until first use."""
     def __getattr__(self, name):
-        return getattr(get_xbrl_parser_service(), name)
+        # Cache the resolved attribute on the proxy so later accesses are
+        # plain instance-dict loads that never re-enter __getattr__
+        value = getattr(get_xbrl_parser_service(), name)
+        setattr(self, name, value)
+        return value
 
 
 xbrl_parser_service = _LazyParser()
@@ -0,0 +1,359 @@
+"""
+Offline unit tests — no network, no Arelle, no Docker.
+
+Covers the lxml-based transformation modules (instance_reader,
+role_extractor) from small in-memory fixture documents, so they run
+anywhere `pytest tests/test_offline_units.py -v` does.
+"""
+import logging
+
+import pytest
+
+from sec_pipeline.config import parse_role_definition
+from sec_pipeline.ingestion.sec_api import SECAPIClient
+from sec_pipeline.transformation import instance_reader, role_extractor
+
+logger = logging.getLogger(__name__)
+
+
+# Minimal but representative XBRL instance: instant + dimensional duration
+# contexts, simple + divide units, numeric / text / nil facts
+INSTANCE_XML = b"""<?xml version="1.0" encoding="utf-8"?>
+<xbrl xmlns="http://www.xbrl.org/2003/instance"
+      xmlns:xbrldi="http://xbrl.org/2006/xbrldi"
+      xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+      xmlns:my="http://example.com/my"
+      xmlns:us-gaap="http://fasb.org/us-gaap/2023"
+      xmlns:dei="http://xbrl.sec.gov/dei/2023">
+  <context id="c1">
+    <entity>
+      <identifier scheme="http://www.sec.gov/CIK">0000789019</identifier>
+    </entity>
+    <period><instant>2023-06-30</instant></period>
+  </context>
+  <context id="c2">
+    <entity>
+      <identifier scheme="http://www.sec.gov/CIK">0000789019</identifier>
+      <segment>
+        <xbrldi:explicitMember dimension="us-gaap:StatementClassOfStockAxis">us-gaap:CommonStockMember</xbrldi:explicitMember>
+        <xbrldi:typedMember dimension="my:ReportLineAxis"><my:Line>L1</my:Line></xbrldi:typedMember>
+      </segment>
+    </entity>
+    <period><startDate>2022-07-01</startDate><endDate>2023-06-30</endDate></period>
+  </context>
+  <unit id="usd"><measure>iso4217:USD</measure></unit>
+  <unit id="usdPerShare">
+    <divide>
+      <unitNumerator><measure>iso4217:USD</measure></unitNumerator>
+      <unitDenominator><measure>xbrli:shares</measure></unitDenominator>
+    </divide>
+  </unit>
+  <us-gaap:Assets contextRef="c1" unitRef="usd" decimals="-6" id="f1">411976000000</us-gaap:Assets>
+  <dei:EntityRegistrantName contextRef="c2">MICROSOFT CORPORATION</dei:EntityRegistrantName>
+  <us-gaap:Liabilities contextRef="c1" unitRef="usd" decimals="-6" xsi:nil="true"/>
+</xbrl>
+"""
+
+
+class TestInstanceReader:
+    """Streaming instance reader — read_xbrl_instance on a fixture document."""
+
+    @pytest.fixture
+    def result(self):
+        return instance_reader.read_xbrl_instance(INSTANCE_XML)
+
+    def test_summary_counts(self, result):
+        assert result["summary"]["total_facts"] == 3
+        assert result["summary"]["total_contexts"] == 2
+        assert result["summary"]["total_units"] == 2
+        # Prefixes of the fact elements, not every namespace in the document
+        assert result["summary"]["namespaces"] == ["dei", "us-gaap"]
+
+    def test_contexts(self, result):
+        by_id = {ctx["id"]: ctx for ctx in result["contexts"]}
+        assert by_id["c1"]["period"] == {"type": "instant", "instant": "2023-06-30"}
+        assert by_id["c1"]["entity"] == {
+            "identifier": "0000789019",
+            "scheme": "http://www.sec.gov/CIK",
+        }
+        assert by_id["c2"]["period"] == {
+            "type": "duration",
+            "start_date": "2022-07-01",
+            "end_date": "2023-06-30",
+        }
+        assert by_id["c2"]["dimensions"] == [
+            {
+                "dimension": "us-gaap:StatementClassOfStockAxis",
+                "type": "explicit",
+                "value": "us-gaap:CommonStockMember",
+            },
+            {"dimension": "my:ReportLineAxis", "type": "typed", "value": "L1"},
+        ]
+        assert "dimensions" not in by_id["c1"]
+
+    def test_units(self, result):
+        by_id = {unit["id"]: unit for unit in result["units"]}
+        assert by_id["usd"]["unit_type"] == "simple"
+        assert by_id["usd"]["measure"] == "iso4217:USD"
+        assert by_id["usdPerShare"]["unit_type"] == "divide"
+        assert by_id["usdPerShare"]["numerator_measure"] == "iso4217:USD"
+        assert by_id["usdPerShare"]["denominator_measure"] == "xbrli:shares"
+
+    def test_facts(self, result):
+        facts = {fact["concept"]: fact for fact in result["facts"]}
+        assets = facts["us-gaap:Assets"]
+        assert assets["concept_name"] == "Assets"
+        assert assets["value"] == "411976000000"
+        assert assets["unit_ref"] == "usd"
+        assert assets["decimals"] == "-6"
+        assert assets["html_anchor_id"] == "f1"
+        assert assets["is_nil"] is False
+        # Context data is attached to each fact
+        assert assets["period"]["instant"] == "2023-06-30"
+        assert assets["entity_identifier"] == "0000789019"
+
+        name = facts["dei:EntityRegistrantName"]
+        assert name["value"] == "MICROSOFT CORPORATION"
+        assert name["period"]["type"] == "duration"
+        assert len(name["dimensions"]) == 2
+
+        assert facts["us-gaap:Liabilities"]["is_nil"] is True
+
+    def test_structural_elements_are_not_facts(self, result):
+        concepts = {fact["concept"] for fact in result["facts"]}
+        # context/unit/entity elements never leak into the fact list
+        assert all(not c.startswith("xbrldi:") for c in concepts)
+        assert len(concepts) == 3
+
+
+# Role-extraction fixtures: instance -> schemaRef -> extension schema with
+# roleTypes + linkbaseRef -> presentation linkbase restricting active roles
+INSTANCE_URL = "https://sec.test/demo.xml"
+
+ROLE_INSTANCE_XML = b"""<?xml version="1.0" encoding="utf-8"?>
+<xbrl xmlns="http://www.xbrl.org/2003/instance"
+      xmlns:link="http://www.xbrl.org/2003/linkbase"
+      xmlns:xlink="http://www.w3.org/1999/xlink">
+  <link:schemaRef xlink:type="simple" xlink:href="demo.xsd"/>
+</xbrl>
+"""
+
+ROLE_SCHEMA_XSD = b"""<?xml version="1.0" encoding="utf-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+           xmlns:link="http://www.xbrl.org/2003/linkbase"
+           xmlns:xlink="http://www.w3.org/1999/xlink">
+  <xs:annotation>
+    <xs:appinfo>
+      <link:linkbaseRef xlink:href="demo_pre.xml"/>
+      <link:roleType roleURI="http://demo/role/BalanceSheet">
+        <link:definition>0000003 - Statement - CONSOLIDATED BALANCE SHEETS</link:definition>
+      </link:roleType>
+      <link:roleType roleURI="http://demo/role/BalanceSheetParenthetical">
+        <link:definition>0000004 - Statement - CONSOLIDATED BALANCE SHEETS (Parenthetical)</link:definition>
+      </link:roleType>
+      <link:roleType roleURI="http://demo/role/Unused">
+        <link:definition>0000009 - Disclosure - Something Unused</link:definition>
+      </link:roleType>
+    </xs:appinfo>
+  </xs:annotation>
+</xs:schema>
+"""
+
+ROLE_PRES_XML = b"""<?xml version="1.0" encoding="utf-8"?>
+<link:linkbase xmlns:link="http://www.xbrl.org/2003/linkbase"
+               xmlns:xlink="http://www.w3.org/1999/xlink">
+  <link:presentationLink xlink:role="http://demo/role/BalanceSheet"/>
+  <link:presentationLink xlink:role="http://demo/role/BalanceSheetParenthetical"/>
+</link:linkbase>
+"""
+
+# Same schema, no linkbaseRef: exercises the every-role fallback
+ROLE_SCHEMA_NO_LINKBASE_XSD = ROLE_SCHEMA_XSD.replace(
+    b'<link:linkbaseRef xlink:href="demo_pre.xml"/>', b""
+)
+
+
+class TestRoleExtractor:
+    """fetch_role_definitions / fetch_statement_descriptions with _fetch mocked."""
+
+    @pytest.fixture
+    def mock_fetch(self, monkeypatch):
+        documents = {
+            INSTANCE_URL: ROLE_INSTANCE_XML,
+            "https://sec.test/demo.xsd": ROLE_SCHEMA_XSD,
+            "https://sec.test/demo_pre.xml": ROLE_PRES_XML,
+        }
+
+        async def fake_fetch(client, url, headers):
+            return documents[url]
+
+        monkeypatch.setattr(role_extractor, "_fetch", fake_fetch)
+        monkeypatch.setattr(role_extractor, "_get_client", lambda: None)
+        return documents
+
+    async def test_roles_restricted_to_presentation_linkbase(self, mock_fetch):
+        roles = await role_extractor.fetch_role_definitions(
+            INSTANCE_URL, user_agent_name="Tests", user_agent_email="test@example.com"
+        )
+
+        # Sorted by URI; the role absent from the presentation linkbase is dropped
+        assert [r["role_uri"] for r in roles] == [
+            "http://demo/role/BalanceSheet",
+            "http://demo/role/BalanceSheetParenthetical",
+        ]
+        assert roles[0]["category"] == "Statement"
+        assert roles[0]["description"] == "CONSOLIDATED BALANCE SHEETS"
+        assert roles[0]["definition"] == "0000003 - Statement - CONSOLIDATED BALANCE SHEETS"
+
+    async def test_fallback_to_all_roles_without_presentation_linkbase(self, mock_fetch):
+        mock_fetch["https://sec.test/demo.xsd"] = ROLE_SCHEMA_NO_LINKBASE_XSD
+
+        roles = await role_extractor.fetch_role_definitions(
+            INSTANCE_URL, user_agent_name="Tests", user_agent_email="test@example.com"
+        )
+
+        assert len(roles) == 3
+        assert roles[-1]["role_uri"] == "http://demo/role/Unused"
+        assert roles[-1]["category"] == "Disclosure"
+
+    async def test_statement_descriptions_skip_excluded_uris(self, mock_fetch):
+        descriptions = await role_extractor.fetch_statement_descriptions(
+            INSTANCE_URL, user_agent_name="Tests", user_agent_email="test@example.com"
+        )
+
+        # The parenthetical role URI is excluded; duplicates collapse
+        assert descriptions == ["CONSOLIDATED BALANCE SHEETS"]
+
+
+class TestExtractXBRLFilings:
+    """Filing-row construction from EDGAR's parallel arrays — no network."""
+
+    @pytest.fixture
+    def client(self):
+        return SECAPIClient(
+            user_agent_name="SEC Pipeline Tests",
+            user_agent_email="test@example.com",
+        )
+
+    @pytest.fixture
+    def filing_arrays(self):
+        # Mirrors the shape of data.sec.gov /submissions filings.recent:
+        # one inline-XBRL 10-Q, one non-XBRL 8-K, one classic .xml instance
+        return {
+            "form": ["10-Q", "8-K", "10-K"],
+            "filingDate": ["2023-08-04", "2023-07-20", "2023-02-02"],
+            "accessionNumber": [
+                "0000320193-23-000077",
+                "0000320193-23-000070",
+                "0000320193-23-000006",
+            ],
+            "reportDate": ["2023-07-01", "", "2022-12-31"],
+            "fileNumber": ["001-36743", "001-36743", "001-36743"],
+            "filmNumber": ["231146597", "231098765", "23577512"],
+            "primaryDocument": ["aapl-20230701.htm", "pressrelease.htm", "aapl-2022.xml"],
+            "primaryDocDescription": ["10-Q", "8-K", "10-K"],
+            "isXBRL": [1, 0, 1],
+            "isInlineXBRL": [1, 0, 0],
+        }
+
+    def test_non_xbrl_rows_are_skipped(self, client, filing_arrays):
+        filings = client._extract_xbrl_filings(filing_arrays, "0000320193")
+
+        assert [f.form_type for f in filings] == ["10-Q", "10-K"]
+        assert all(f.is_xbrl for f in filings)
+
+    def test_inline_htm_derives_instance_url(self, client, filing_arrays):
+        filings = client._extract_xbrl_filings(filing_arrays, "0000320193")
+
+        inline = filings[0]
+        base = "https://www.sec.gov/Archives/edgar/data/0000320193/000032019323000077"
+        assert inline.is_inline_xbrl is True
+        assert inline.primary_document_url == f"{base}/aapl-20230701.htm"
+        assert inline.xbrl_instance_url == f"{base}/aapl-20230701_htm.xml"
+
+    def test_xml_primary_document_is_the_instance(self, client, filing_arrays):
+        filings = client._extract_xbrl_filings(filing_arrays, "0000320193")
+
+        classic = filings[1]
+        assert classic.is_inline_xbrl is False
+        assert classic.xbrl_instance_url == classic.primary_document_url
+        assert classic.xbrl_instance_url.endswith("/aapl-2022.xml")
+
+    def test_ragged_arrays_pad_missing_columns_with_none(self, client, filing_arrays):
+        # EDGAR occasionally ships shorter optional arrays; zip_longest
+        # pads the missing tail values with None instead of raising
+        filing_arrays["reportDate"] = filing_arrays["reportDate"][:1]
+        filing_arrays["filmNumber"] = []
+        filing_arrays["primaryDocDescription"] = filing_arrays["primaryDocDescription"][:2]
+
+        filings = client._extract_xbrl_filings(filing_arrays, "0000320193")
+
+        assert len(filings) == 2
+        ragged = filings[1]
+        assert ragged.report_date is None
+        assert ragged.film_number is None
+        assert ragged.primary_doc_description is None
+        # Columns that were present are unaffected
+        assert ragged.accession_number == "0000320193-23-000006"
+        assert ragged.xbrl_instance_url.endswith("/aapl-2022.xml")
+
+
+class TestStripDescriptionBoilerplate:
+    """Trailing-boilerplate removal ahead of description normalization."""
+
+    def test_single_suffixes(self):
+        from sec_pipeline.config import strip_description_boilerplate
+
+        assert strip_description_boilerplate("Balance Sheets (Unaudited)") == "Balance Sheets"
+        assert strip_description_boilerplate("Balance Sheets 2023") == "Balance Sheets"
+
+    def test_stacked_suffixes_collapse_fully(self):
+        from sec_pipeline.config import strip_description_boilerplate
+
+        assert strip_description_boilerplate("Balance Sheets (Unaudited) 2023") == "Balance Sheets"
+        assert strip_description_boilerplate(
+            "Balance Sheets 2023 (Parenthetical) (Restated)"
+        ) == "Balance Sheets"
+
+    def test_interior_boilerplate_is_kept(self):
+        from sec_pipeline.config import strip_description_boilerplate
+
+        assert strip_description_boilerplate(
+            "Balance Sheets (Unaudited) Supplement"
+        ) == "Balance Sheets (Unaudited) Supplement"
+
+
+class TestNormalizeDescription:
+    """Canonicalization used to deduplicate role descriptions."""
+
+    def test_punctuation_variants_share_a_key(self):
+        from sec_pipeline.config import normalize_description
+
+        assert normalize_description("Balance-Sheets") == "balance sheets"
+        assert normalize_description("Balance Sheets") == "balance sheets"
+        assert normalize_description("BALANCE / SHEETS") == "balance sheets"
+
+    def test_apostrophes_are_dropped_not_spaced(self):
+        from sec_pipeline.config import normalize_description
+
+        assert normalize_description("Stockholders' Equity") == "stockholders equity"
+        assert normalize_description("Stockholders Equity") == "stockholders equity"
+
+
+class TestParseRoleDefinition:
+    """EDGAR role-definition parsing — fast path and regex fallback."""
+
+    def test_well_formed_definition(self):
+        parsed = parse_role_definition("0000003 - Statement - CONSOLIDATED BALANCE SHEETS")
+        assert parsed == ("Statement", "CONSOLIDATED BALANCE SHEETS")
+
+    def test_description_containing_separator(self):
+        parsed = parse_role_definition("0000007 - Disclosure - Leases - Narrative")
+        assert parsed == ("Disclosure", "Leases - Narrative")
+
+    def test_malformed_spacing_falls_back_to_regex(self):
+        parsed = parse_role_definition("0000003- Statement -CONSOLIDATED BALANCE SHEETS")
+        assert parsed == ("Statement", "CONSOLIDATED BALANCE SHEETS")
+
+    def test_nonconforming_definition_returns_none(self):
+        assert parse_role_definition("Just a description") is None